@@ -41,7 +41,9 @@ from .market_maker_pnl import (
     HedgeStatus,
     MarketMakerPosition,
     MarketMakerSimulator,
+    Quote,
     simulate_market_maker_crisis,
+    simulate_market_maker_crisis_batch,
 )
 
 # Arbitrage analysis (Extensions Track)
@@ -110,7 +112,9 @@ __all__ = [
     "HedgeStatus",
     "MarketMakerPosition",
     "MarketMakerSimulator",
+    "Quote",
     "simulate_market_maker_crisis",
+    "simulate_market_maker_crisis_batch",
     # Arbitrage Analysis
     "ArbitrageType",
     "BarrierType",
@@ -23,9 +23,13 @@ References:
 - SEC Staff Guidance on LULD Implementation
 """
 
+from functools import lru_cache
 from typing import Tuple, Literal
 from datetime import datetime, time
 
+import numpy as np
+import pandas as pd
+
 # Band Configuration Constants (SEC Release 34-67091)
 PRICE_THRESHOLD_HIGH = 3.00  # Above this: tier-specific bands
 PRICE_THRESHOLD_LOW = 0.75   # Below this: special penny stock rules
@@ -48,6 +52,12 @@ OPENING_END = time(9, 45)      # 9:45 AM
 CLOSING_START = time(15, 35)   # 3:35 PM
 MARKET_CLOSE = time(16, 0)     # 4:00 PM
 
+# Time-of-day codes used by the vectorized (array) helpers
+TOD_NORMAL = 0
+TOD_OPENING = 1
+TOD_CLOSING = 2
+_TOD_LABELS = np.array(['normal', 'opening', 'closing'], dtype=object)
+
 
 def calculate_luld_bands(
     reference_price: float,
@@ -157,6 +167,23 @@ def calculate_luld_bands(
     if leverage <= 0 or leverage > 3:
         raise ValueError(f"leverage must be in (0, 3], got {leverage}")
 
+    return _luld_bands_cached(float(reference_price), int(tier), time_of_day, float(leverage))
+
+
+@lru_cache(maxsize=4096)
+def _luld_bands_cached(
+    reference_price: float,
+    tier: int,
+    time_of_day: str,
+    leverage: float
+) -> Tuple[float, float, float]:
+    """
+    Band calculation behind calculate_luld_bands (inputs already validated).
+
+    The calculation is pure, and Reference Prices only move on the 1%
+    trigger or the 5-minute recalculation, so simulations repeatedly ask
+    for the same bands. Results are memoized on the exact inputs.
+    """
     # Step 1: Determine base percentage by price tier
     if reference_price >= PRICE_THRESHOLD_HIGH:
         # Above $3: Different percentages for Tier 1 vs Tier 2
@@ -209,6 +236,11 @@ def calculate_luld_bands(
     return lower_band, upper_band, final_pct
 
 
+# Allow callers (and tests) to reset the memoized bands
+calculate_luld_bands.cache_clear = _luld_bands_cached.cache_clear
+calculate_luld_bands.cache_info = _luld_bands_cached.cache_info
+
+
 def get_time_of_day_category(dt: datetime) -> Literal['opening', 'closing', 'normal']:
     """
     Determine LULD time-of-day category for band calculation.
@@ -368,78 +400,227 @@ def analyze_flash_crash_halt(
     }
 
 
+def _seconds_of_day(t: time) -> int:
+    """Convert a wall-clock time to seconds since midnight."""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def get_time_of_day_category_vec(timestamps) -> np.ndarray:
+    """
+    Vectorized version of get_time_of_day_category.
+
+    Parameters
+    ----------
+    timestamps : array-like of datetime
+        Timestamps to categorize (Series, DatetimeIndex, list, ...)
+
+    Returns
+    -------
+    np.ndarray
+        int8 codes: TOD_NORMAL (0), TOD_OPENING (1), TOD_CLOSING (2)
+    """
+    idx = pd.DatetimeIndex(timestamps)
+    # Fractional seconds since midnight; boundaries match the scalar version
+    secs = (idx.hour.values * 3600 + idx.minute.values * 60 + idx.second.values
+            + idx.microsecond.values / 1e6)
+
+    opening = (secs >= _seconds_of_day(MARKET_OPEN)) & (secs < _seconds_of_day(OPENING_END))
+    closing = (secs >= _seconds_of_day(CLOSING_START)) & (secs < _seconds_of_day(MARKET_CLOSE))
+
+    codes = np.full(len(idx), TOD_NORMAL, dtype=np.int8)
+    codes[opening] = TOD_OPENING
+    codes[closing] = TOD_CLOSING
+    return codes
+
+
+def calculate_luld_bands_vec(
+    reference_price: np.ndarray,
+    tier: np.ndarray,
+    time_of_day: np.ndarray,
+    leverage: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized version of calculate_luld_bands.
+
+    Parameters
+    ----------
+    reference_price : np.ndarray
+        Reference Prices (must all be positive)
+    tier : np.ndarray
+        Tier per row (1 or 2)
+    time_of_day : np.ndarray
+        Time-of-day codes from get_time_of_day_category_vec
+    leverage : np.ndarray
+        Leverage factor per row, in (0, 3]
+
+    Returns
+    -------
+    tuple of np.ndarray (lower_band, upper_band, percentage)
+        Same semantics as calculate_luld_bands, element-wise
+
+    Raises
+    ------
+    ValueError
+        If any element is invalid
+    """
+    ref = np.asarray(reference_price, dtype=np.float64)
+    tier = np.asarray(tier)
+    tod = np.asarray(time_of_day)
+    lev = np.asarray(leverage, dtype=np.float64)
+
+    # Input validation (same rules as the scalar version)
+    if np.any(ref <= 0):
+        raise ValueError(f"reference_price must be positive, got {ref[ref <= 0][0]}")
+
+    bad_tier = ~np.isin(tier, [1, 2])
+    if np.any(bad_tier):
+        raise ValueError(f"tier must be 1 or 2, got {tier[bad_tier][0]}")
+
+    bad_tod = ~np.isin(tod, [TOD_NORMAL, TOD_OPENING, TOD_CLOSING])
+    if np.any(bad_tod):
+        raise ValueError(f"time_of_day code must be 0, 1 or 2, got {tod[bad_tod][0]}")
+
+    bad_lev = (lev <= 0) | (lev > 3)
+    if np.any(bad_lev):
+        raise ValueError(f"leverage must be in (0, 3], got {lev[bad_lev][0]}")
+
+    # Step 1: Base percentage by price tier
+    # Below $0.75: 75% or $0.15, whichever gives the larger band
+    low_pct = np.where(ref * LOW_PRICE_BAND_PCT >= FLAT_BAND_FLOOR,
+                       LOW_PRICE_BAND_PCT, FLAT_BAND_FLOOR / ref)
+    high_pct = np.where(tier == 1, TIER1_HIGH_BAND_PCT, TIER2_HIGH_BAND_PCT)
+    base_pct = np.where(ref >= PRICE_THRESHOLD_HIGH, high_pct,
+                        np.where(ref >= PRICE_THRESHOLD_LOW, MID_PRICE_BAND_PCT, low_pct))
+
+    # Step 2: Time-of-day multiplier
+    time_multiplier = np.where(tod == TOD_OPENING, TIME_MULTIPLIER_OPENING,
+                               np.where(tod == TOD_CLOSING, TIME_MULTIPLIER_CLOSING,
+                                        TIME_MULTIPLIER_NORMAL))
+    base_pct = base_pct * time_multiplier
+
+    # Step 3: Leverage multiplier
+    final_pct = base_pct * lev
+
+    lower_band = np.maximum(0.00, ref * (1 - final_pct))
+    upper_band = ref * (1 + final_pct)
+
+    return lower_band, upper_band, final_pct
+
+
+def analyze_flash_crash_halt_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Batch version of analyze_flash_crash_halt operating on a DataFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        One observation per row with columns: ticker, reference_price,
+        actual_price, tier, timestamp and (optionally) leverage.
+        Missing leverage defaults to 1.0.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per input row (same index) with the same columns as the
+        dict returned by analyze_flash_crash_halt
+
+    Examples
+    --------
+    >>> from datetime import datetime
+    >>> obs = pd.DataFrame({
+    ...     'ticker': ['DVY', 'RSP'],
+    ...     'reference_price': [75.50, 76.80],
+    ...     'actual_price': [65.20, 43.77],
+    ...     'tier': [1, 1],
+    ...     'timestamp': [datetime(2015, 8, 24, 9, 35), datetime(2015, 8, 24, 9, 38)],
+    ... })
+    >>> analyze_flash_crash_halt_df(obs)['halt_triggered'].tolist()
+    [True, True]
+    """
+    ref = df['reference_price'].to_numpy(dtype=np.float64)
+    act = df['actual_price'].to_numpy(dtype=np.float64)
+    tier = df['tier'].to_numpy()
+    if 'leverage' in df.columns:
+        lev = df['leverage'].to_numpy(dtype=np.float64)
+    else:
+        lev = np.ones(len(df))
+
+    tod = get_time_of_day_category_vec(df['timestamp'])
+    lower_band, upper_band, band_pct = calculate_luld_bands_vec(ref, tier, tod, lev)
+
+    price_change = act - ref
+    price_change_pct = (price_change / ref) * 100
+
+    halt_triggered = (act <= lower_band) | (act >= upper_band)
+
+    # Below reference: distance to lower band, otherwise to upper band
+    below = act < ref
+    distance_from_band = np.where(below, act - lower_band, act - upper_band)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distance_from_band_pct = np.where(
+            below,
+            np.where(lower_band > 0,
+                     distance_from_band / lower_band * 100,
+                     np.where(distance_from_band < 0, -100.0, 0.0)),
+            distance_from_band / upper_band * 100
+        )
+
+    return pd.DataFrame({
+        'ticker': df['ticker'].to_numpy(),
+        'timestamp': df['timestamp'].to_numpy(),
+        'time_category': _TOD_LABELS[tod],
+        'reference_price': ref,
+        'actual_price': act,
+        'lower_band': lower_band,
+        'upper_band': upper_band,
+        'band_percentage': band_pct * 100,
+        'price_change': price_change,
+        'price_change_pct': price_change_pct,
+        'halt_triggered': halt_triggered,
+        'distance_from_band': distance_from_band,
+        'distance_from_band_pct': distance_from_band_pct,
+        'tier': tier,
+        'leverage': lev
+    }, index=df.index)
+
+
 if __name__ == '__main__':
     # Demonstrate with August 24, 2015 examples
     from datetime import datetime
 
+    # (ticker, description, reference price, actual price, timestamp)
+    _DEMO_CASES = [
+        ('DVY', 'iShares Dividend ETF', 75.50, 65.20, datetime(2015, 8, 24, 9, 35, 0)),
+        ('RSP', 'Equal-Weight S&P 500', 76.80, 43.77, datetime(2015, 8, 24, 9, 38, 0)),
+        ('SPLV', 'Low Volatility ETF', 39.50, 21.18, datetime(2015, 8, 24, 9, 40, 0)),
+    ]
+
     print("="*80)
     print("LULD BAND ANALYSIS - AUGUST 24, 2015 FLASH CRASH")
     print("Based on SEC Release No. 34-67091 and FINRA Rule 6190")
     print("="*80)
     print()
 
-    # DVY at 9:35 AM
-    print("DVY (iShares Dividend ETF) at 9:35 AM:")
-    print("-" * 60)
-    result = analyze_flash_crash_halt(
-        ticker='DVY',
-        reference_price=75.50,
-        actual_price=65.20,
-        tier=1,
-        timestamp=datetime(2015, 8, 24, 9, 35, 0)
-    )
-
-    print(f"Time: {result['timestamp'].strftime('%I:%M %p')} ({result['time_category']} period)")
-    print(f"Reference Price: ${result['reference_price']:.2f}")
-    print(f"LULD Bands: ${result['lower_band']:.2f} - ${result['upper_band']:.2f}")
-    print(f"  (±{result['band_percentage']:.1f}% - doubled for opening period)")
-    print(f"Actual Price: ${result['actual_price']:.2f}")
-    print(f"Price Change: ${result['price_change']:.2f} ({result['price_change_pct']:.1f}%)")
-    print(f"Halt Triggered: {'YES' if result['halt_triggered'] else 'NO'}")
-    print(f"Distance from Lower Band: ${result['distance_from_band']:.2f} ({result['distance_from_band_pct']:.1f}%)")
-    print()
-
-    # RSP at 9:38 AM
-    print("RSP (Equal-Weight S&P 500) at 9:38 AM:")
-    print("-" * 60)
-    result = analyze_flash_crash_halt(
-        ticker='RSP',
-        reference_price=76.80,
-        actual_price=43.77,
-        tier=1,
-        timestamp=datetime(2015, 8, 24, 9, 38, 0)
-    )
-
-    print(f"Time: {result['timestamp'].strftime('%I:%M %p')} ({result['time_category']} period)")
-    print(f"Reference Price: ${result['reference_price']:.2f}")
-    print(f"LULD Bands: ${result['lower_band']:.2f} - ${result['upper_band']:.2f}")
-    print(f"  (±{result['band_percentage']:.1f}% - doubled for opening period)")
-    print(f"Actual Price: ${result['actual_price']:.2f}")
-    print(f"Price Change: ${result['price_change']:.2f} ({result['price_change_pct']:.1f}%)")
-    print(f"Halt Triggered: {'YES' if result['halt_triggered'] else 'NO'}")
-    print(f"Distance from Lower Band: ${result['distance_from_band']:.2f} ({result['distance_from_band_pct']:.1f}%)")
-    print()
-
-    # SPLV at 9:40 AM
-    print("SPLV (Low Volatility ETF) at 9:40 AM:")
-    print("-" * 60)
-    result = analyze_flash_crash_halt(
-        ticker='SPLV',
-        reference_price=39.50,
-        actual_price=21.18,
-        tier=1,
-        timestamp=datetime(2015, 8, 24, 9, 40, 0)
-    )
-
-    print(f"Time: {result['timestamp'].strftime('%I:%M %p')} ({result['time_category']} period)")
-    print(f"Reference Price: ${result['reference_price']:.2f}")
-    print(f"LULD Bands: ${result['lower_band']:.2f} - ${result['upper_band']:.2f}")
-    print(f"  (±{result['band_percentage']:.1f}% - doubled for opening period)")
-    print(f"Actual Price: ${result['actual_price']:.2f}")
-    print(f"Price Change: ${result['price_change']:.2f} ({result['price_change_pct']:.1f}%)")
-    print(f"Halt Triggered: {'YES' if result['halt_triggered'] else 'NO'}")
-    print(f"Distance from Lower Band: ${result['distance_from_band']:.2f} ({result['distance_from_band_pct']:.1f}%)")
-    print()
+    for ticker, description, reference_price, actual_price, timestamp in _DEMO_CASES:
+        print(f"{ticker} ({description}) at {timestamp.strftime('%I:%M %p').lstrip('0')}:")
+        print("-" * 60)
+        result = analyze_flash_crash_halt(
+            ticker=ticker,
+            reference_price=reference_price,
+            actual_price=actual_price,
+            tier=1,
+            timestamp=timestamp
+        )
+
+        print(f"Time: {result['timestamp'].strftime('%I:%M %p')} ({result['time_category']} period)")
+        print(f"Reference Price: ${result['reference_price']:.2f}")
+        print(f"LULD Bands: ${result['lower_band']:.2f} - ${result['upper_band']:.2f}")
+        print(f"  (±{result['band_percentage']:.1f}% - doubled for opening period)")
+        print(f"Actual Price: ${result['actual_price']:.2f}")
+        print(f"Price Change: ${result['price_change']:.2f} ({result['price_change_pct']:.1f}%)")
+        print(f"Halt Triggered: {'YES' if result['halt_triggered'] else 'NO'}")
+        print(f"Distance from Lower Band: ${result['distance_from_band']:.2f} ({result['distance_from_band_pct']:.1f}%)")
+        print()
 
     print("="*80)
     print("KEY INSIGHT: All three ETFs triggered LULD halts, but fell so far")
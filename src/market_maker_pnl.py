@@ -8,19 +8,38 @@ manage inventory, hedge risk, and calculate P&L under stress.
 
 Classes:
     HedgeStatus: Enum for market maker hedging capability
+    Quote: NamedTuple holding a market maker quote
     MarketMakerPosition: Dataclass representing position and risk
     MarketMakerSimulator: Simulates market maker behavior and P&L
 
 Functions:
     simulate_market_maker_crisis: Run complete crisis simulation
+    simulate_market_maker_crisis_batch: Run many independent scenarios in parallel
+
+The crisis replay runs in a numba-compiled kernel when numba is installed
+and as plain Python otherwise (same results, slower).
 """
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba not installed - kernels run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 class HedgeStatus(Enum):
     """
@@ -35,6 +54,38 @@ class HedgeStatus(Enum):
     NONE = "no_hedge_available"
 
 
+class Quote(NamedTuple):
+    """
+    Market maker quote.
+
+    A side that is not being quoted has price None and size 0; spread_bps
+    is then the width the quoted side would imply. Fields can
+    also be read by name (quote['spread_bps']) for compatibility with the
+    previous dictionary return value.
+    """
+    bid: Optional[float]
+    ask: Optional[float]
+    bid_size: int
+    ask_size: int
+    spread_bps: float
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+# Integer hedge-status codes used by the array-based crisis simulation
+_HEDGE_FULL = 0
+_HEDGE_PARTIAL = 1
+_HEDGE_NONE = 2
+
+# Quoted spread by hedge code, in the same form as quote_market:
+#   target_spread_bps * _SPREAD_MULT[code] * (1 + _VOL_WIDENING[code] * vol / 0.20)
+_SPREAD_MULT = np.array([1.0, 10.0, 100.0])
+_VOL_WIDENING = np.array([1.0, 1.0, 0.0])
+
+
 @dataclass
 class MarketMakerPosition:
     """
@@ -52,6 +103,11 @@ class MarketMakerPosition:
         timestamp: Time of position snapshot
         fair_value: Current fair value (NAV/iNAV)
     """
+    # Fixed attribute layout (no per-instance __dict__); declared by hand
+    # rather than dataclass(slots=True) to keep Python < 3.10 support
+    __slots__ = ('etf_inventory', 'underlying_hedge', 'futures_hedge',
+                 'etf_entry_price', 'hedge_entry_price', 'timestamp', 'fair_value')
+
     etf_inventory: int  # positive = long, negative = short
     underlying_hedge: int  # offsetting position in basket
     futures_hedge: int  # S&P futures position
@@ -113,6 +169,36 @@ class MarketMakerPosition:
 
         return etf_pnl + hedge_pnl
 
+    @staticmethod
+    def batch_inventory_pnl(inventory: np.ndarray,
+                            entry_prices: np.ndarray,
+                            current_prices: np.ndarray) -> float:
+        """
+        Calculate total ETF P&L across many positions at once.
+
+        Equivalent to summing etf_inventory * (current_price - etf_entry_price)
+        over the positions, computed as a single dot product.
+
+        Args:
+            inventory: ETF inventory per position (shares)
+            entry_prices: Average entry price per position
+            current_prices: Current ETF price per position
+
+        Returns:
+            Total unrealized ETF P&L in dollars (excluding hedges)
+
+        Examples:
+            >>> MarketMakerPosition.batch_inventory_pnl(
+            ...     np.array([10000, -5000]),
+            ...     np.array([100.0, 50.0]),
+            ...     np.array([102.0, 49.0]))
+            25000.0  # 10000 * $2 + (-5000) * -$1
+        """
+        inventory = np.asarray(inventory, dtype=np.float64)
+        price_change = (np.asarray(current_prices, dtype=np.float64)
+                        - np.asarray(entry_prices, dtype=np.float64))
+        return float(np.vdot(inventory, price_change))
+
     def gamma_risk(self) -> float:
         """
         Estimate gamma risk (convexity of P&L).
@@ -132,6 +218,24 @@ class MarketMakerPosition:
         return abs(self.net_delta()) * 0.40
 
 
+def _reserve_rows(columns: Dict[str, np.ndarray], n_filled: int, needed: int) -> None:
+    """
+    Grow history column arrays in place so they can hold `needed` rows.
+
+    Capacity at least doubles on each grow, so appending one row at a time
+    stays amortized O(1).
+    """
+    capacity = len(next(iter(columns.values())))
+    if needed <= capacity:
+        return
+
+    new_capacity = max(needed, 2 * capacity, 64)
+    for name, values in columns.items():
+        grown = np.empty(new_capacity, dtype=values.dtype)
+        grown[:n_filled] = values[:n_filled]
+        columns[name] = grown
+
+
 class MarketMakerSimulator:
     """
     Simulate market maker behavior during flash crash.
@@ -156,17 +260,35 @@ class MarketMakerSimulator:
         max_inventory: Maximum inventory limit (shares)
         target_spread_bps: Target spread in basis points
         position: Current position and risk
-        pnl_history: History of P&L snapshots
-        position_history: History of positions
+        pnl_history: History of P&L snapshots (list of dicts)
+        pnl_history_df: History of P&L snapshots as a DataFrame
+        position_history: History of positions (list of dicts)
+        position_history_df: History of positions as a DataFrame
         hedge_status: Current hedging capability
         active: Whether still quoting markets
     """
 
+    # Column layouts of the history arrays
+    # (only total P&L is stored; the other P&L fields are derived from it)
+    _PNL_DTYPES = {
+        'timestamp': 'datetime64[ns]',
+        'total_pnl': np.float64,
+    }
+    _POSITION_DTYPES = {
+        'timestamp': 'datetime64[ns]',
+        'etf_inventory': np.int64,
+        'hedge_position': np.int64,
+        'net_delta': np.int64,
+        'fair_value': np.float64,
+        'etf_price': np.float64,
+    }
+
     def __init__(self,
                  symbol: str,
                  initial_capital: float = 10_000_000,
                  max_inventory: int = 100_000,
-                 target_spread_bps: float = 2.0):
+                 target_spread_bps: float = 2.0,
+                 history_size: int = 0):
         """
         Initialize market maker simulator.
 
@@ -175,6 +297,8 @@ class MarketMakerSimulator:
             initial_capital: Starting capital in dollars
             max_inventory: Maximum inventory in shares
             target_spread_bps: Target spread in normal conditions
+            history_size: Expected number of P&L snapshots / trades, used to
+                preallocate the history arrays (they grow as needed)
 
         Raises:
             ValueError: If parameters are invalid
@@ -203,16 +327,104 @@ class MarketMakerSimulator:
             fair_value=0.0
         )
 
-        self.pnl_history = []
-        self.position_history = []
+        # Histories are stored column-wise in preallocated arrays
+        self._n_pnl = 0
+        self._pnl = {name: np.empty(history_size, dtype=dtype)
+                     for name, dtype in self._PNL_DTYPES.items()}
+        self._n_positions = 0
+        self._positions = {name: np.empty(history_size, dtype=dtype)
+                           for name, dtype in self._POSITION_DTYPES.items()}
         self.hedge_status = HedgeStatus.FULL
 
         self.active = True  # Still quoting markets
 
+    @property
+    def pnl_history(self) -> List[Dict[str, float]]:
+        """
+        History of P&L snapshots, one dict per mark_to_market call.
+
+        Built on access from the underlying history arrays; use
+        pnl_history_df for analysis.
+        """
+        return self.pnl_history_df.to_dict('records')
+
+    @property
+    def pnl_history_df(self) -> pd.DataFrame:
+        """History of P&L snapshots as a DataFrame (one row per snapshot)."""
+        total_pnl = self._pnl['total_pnl'][:self._n_pnl].copy()
+        return pd.DataFrame({
+            'timestamp': self._pnl['timestamp'][:self._n_pnl].copy(),
+            'etf_pnl': total_pnl,
+            'hedge_pnl': 0.0,  # Simplified - hedge P&L included in etf_pnl
+            'total_pnl': total_pnl,
+            'return_pct': (total_pnl / self.initial_capital) * 100,
+            'capital': self.initial_capital + total_pnl
+        })
+
+    @property
+    def position_history(self) -> List[Dict[str, float]]:
+        """
+        History of positions, one dict per accepted trade.
+
+        Built on access from the underlying history arrays; use
+        position_history_df for analysis.
+        """
+        return self.position_history_df.to_dict('records')
+
+    @property
+    def position_history_df(self) -> pd.DataFrame:
+        """History of positions as a DataFrame (one row per accepted trade)."""
+        return pd.DataFrame({name: column[:self._n_positions].copy()
+                             for name, column in self._positions.items()})
+
+    def _append_pnl(self, timestamps, total_pnl) -> None:
+        """
+        Append one or more P&L rows to the history arrays.
+
+        Args:
+            timestamps: Timestamp(s) of the rows, or None for NaT
+            total_pnl: Total P&L per row
+        """
+        total_pnl = np.atleast_1d(np.asarray(total_pnl, dtype=np.float64))
+        needed = self._n_pnl + len(total_pnl)
+        _reserve_rows(self._pnl, self._n_pnl, needed)
+
+        rows = slice(self._n_pnl, needed)
+        self._pnl['timestamp'][rows] = np.datetime64('NaT') if timestamps is None else timestamps
+        self._pnl['total_pnl'][rows] = total_pnl
+        self._n_pnl = needed
+
+    def _append_positions(self, timestamps, etf_inventory, hedge_position,
+                          fair_value, etf_price) -> None:
+        """
+        Append one or more position rows to the history arrays.
+
+        Args:
+            timestamps: Timestamp(s) of the trades
+            etf_inventory: ETF inventory after each trade
+            hedge_position: Underlying hedge after each trade
+            fair_value: Fair value at each trade
+            etf_price: Execution price of each trade
+        """
+        etf_inventory = np.atleast_1d(np.asarray(etf_inventory, dtype=np.int64))
+        hedge_position = np.asarray(hedge_position, dtype=np.int64)
+        needed = self._n_positions + len(etf_inventory)
+        _reserve_rows(self._positions, self._n_positions, needed)
+
+        rows = slice(self._n_positions, needed)
+        self._positions['timestamp'][rows] = timestamps
+        self._positions['etf_inventory'][rows] = etf_inventory
+        self._positions['hedge_position'][rows] = hedge_position
+        self._positions['net_delta'][rows] = (etf_inventory + hedge_position
+                                              + self.position.futures_hedge)
+        self._positions['fair_value'][rows] = fair_value
+        self._positions['etf_price'][rows] = etf_price
+        self._n_positions = needed
+
     def quote_market(self,
                     fair_value: float,
                     hedge_status: HedgeStatus,
-                    volatility: float) -> Optional[Dict[str, float]]:
+                    volatility: float) -> Optional[Quote]:
         """
         Decide whether and how to quote the market.
 
@@ -228,38 +440,41 @@ class MarketMakerSimulator:
             volatility: Current market volatility (annualized)
 
         Returns:
-            Quote dictionary with bid, ask, sizes and spread_bps,
+            Quote with bid, ask, sizes and spread_bps,
             or None if withdrawing quotes
 
         Examples:
             >>> mm = MarketMakerSimulator('SPY')
             >>> quote = mm.quote_market(200.0, HedgeStatus.FULL, 0.20)
-            >>> quote['spread_bps']
+            >>> quote.spread_bps
             2.0  # Normal spread
         """
+        inventory = self.position.etf_inventory
+        abs_inventory = abs(inventory)
+
         # Check if inventory limit reached
-        if abs(self.position.etf_inventory) > self.max_inventory * 0.9:
+        if abs_inventory > self.max_inventory * 0.9:
             # Near limit - quote only to reduce inventory
-            if self.position.etf_inventory > 0:
+            if inventory > 0:
                 # Long - only offer (sell)
                 spread = fair_value * (volatility * 5)  # Very wide
-                return {
-                    'bid': None,
-                    'ask': fair_value + spread/2,
-                    'bid_size': 0,
-                    'ask_size': min(10000, abs(self.position.etf_inventory)),
-                    'spread_bps': np.inf
-                }
+                return Quote(
+                    bid=None,
+                    ask=fair_value + spread/2,
+                    bid_size=0,
+                    ask_size=min(10000, abs_inventory),
+                    spread_bps=volatility * 5 * 10000
+                )
             else:
                 # Short - only bid (buy)
                 spread = fair_value * (volatility * 5)
-                return {
-                    'bid': fair_value - spread/2,
-                    'ask': None,
-                    'bid_size': min(10000, abs(self.position.etf_inventory)),
-                    'ask_size': 0,
-                    'spread_bps': np.inf
-                }
+                return Quote(
+                    bid=fair_value - spread/2,
+                    ask=None,
+                    bid_size=min(10000, abs_inventory),
+                    ask_size=0,
+                    spread_bps=volatility * 5 * 10000
+                )
 
         # Adjust spread based on hedge availability and volatility
         if hedge_status == HedgeStatus.FULL:
@@ -285,7 +500,7 @@ class MarketMakerSimulator:
         # Skew quotes to encourage mean reversion
         # If long (+inventory): skew quotes DOWN to encourage selling
         # If short (-inventory): skew quotes UP to encourage buying
-        inventory_ratio = self.position.etf_inventory / self.max_inventory
+        inventory_ratio = inventory / self.max_inventory
 
         # Skew factor: 0.5 bps per 1% of max inventory
         # At max inventory (100%), skew = 50 bps = 0.5% of price
@@ -296,20 +511,21 @@ class MarketMakerSimulator:
         bid = fair_value - spread/2 - skew
         ask = fair_value + spread/2 - skew
 
-        return {
-            'bid': bid,
-            'ask': ask,
-            'bid_size': 10000,
-            'ask_size': 10000,
-            'spread_bps': spread_bps
-        }
+        return Quote(
+            bid=bid,
+            ask=ask,
+            bid_size=10000,
+            ask_size=10000,
+            spread_bps=spread_bps
+        )
 
     def execute_trade(self,
                      size: int,
                      price: float,
                      side: str,
                      fair_value: float,
-                     can_hedge: bool) -> bool:
+                     can_hedge: bool,
+                     timestamp: Optional[pd.Timestamp] = None) -> bool:
         """
         Execute trade as market maker.
 
@@ -323,6 +539,7 @@ class MarketMakerSimulator:
             side: Incoming order side ('buy' or 'sell')
             fair_value: Current fair value
             can_hedge: Whether hedging is possible
+            timestamp: Market time of the trade (defaults to wall-clock now)
 
         Returns:
             True if trade accepted, False if rejected
@@ -358,7 +575,7 @@ class MarketMakerSimulator:
 
         self.position.etf_inventory = new_inventory
         self.position.fair_value = fair_value
-        self.position.timestamp = pd.Timestamp.now()
+        self.position.timestamp = timestamp if timestamp is not None else pd.Timestamp.now()
 
         # Attempt to hedge
         if can_hedge:
@@ -382,18 +599,14 @@ class MarketMakerSimulator:
                 self.position.underlying_hedge = new_hedge_size
 
         # Record position
-        self.position_history.append({
-            'timestamp': self.position.timestamp,
-            'etf_inventory': self.position.etf_inventory,
-            'hedge_position': self.position.underlying_hedge,
-            'net_delta': self.position.net_delta(),
-            'fair_value': fair_value,
-            'etf_price': price
-        })
+        self._append_positions(self.position.timestamp, self.position.etf_inventory,
+                               self.position.underlying_hedge, fair_value, price)
 
         return True
 
-    def mark_to_market(self, etf_price: float) -> Dict[str, float]:
+    def mark_to_market(self,
+                       etf_price: float,
+                       timestamp: Optional[pd.Timestamp] = None) -> Dict[str, float]:
         """
         Calculate current P&L.
 
@@ -402,9 +615,12 @@ class MarketMakerSimulator:
 
         Args:
             etf_price: Current ETF market price
+            timestamp: Market time of the snapshot. Left as NaT when not
+                given (wall-clock time carries no market information)
 
         Returns:
             Dictionary with P&L breakdown:
+                - timestamp: Market time of the snapshot (or NaT)
                 - etf_pnl: P&L on ETF position
                 - hedge_pnl: P&L on hedge positions
                 - total_pnl: Net P&L
@@ -421,7 +637,7 @@ class MarketMakerSimulator:
         inventory_pnl = self.position.inventory_risk_usd(etf_price)
 
         pnl_dict = {
-            'timestamp': pd.Timestamp.now(),
+            'timestamp': timestamp if timestamp is not None else pd.NaT,
             'etf_pnl': inventory_pnl,
             'hedge_pnl': 0.0,  # Simplified - hedge P&L included in inventory_pnl
             'total_pnl': inventory_pnl,
@@ -429,7 +645,7 @@ class MarketMakerSimulator:
             'capital': self.initial_capital + inventory_pnl
         }
 
-        self.pnl_history.append(pnl_dict)
+        self._append_pnl(timestamp, inventory_pnl)
         return pnl_dict
 
     def calculate_risk_metrics(self) -> Dict[str, float]:
@@ -456,31 +672,248 @@ class MarketMakerSimulator:
             >>> metrics['current_delta']
             0  # Market neutral
         """
-        if not self.pnl_history:
+        if self._n_pnl == 0:
             return {}
 
-        pnl_series = pd.Series([p['total_pnl'] for p in self.pnl_history])
+        pnl = self._pnl['total_pnl'][:self._n_pnl]
 
         # Calculate VaR and Expected Shortfall
-        var_95 = pnl_series.quantile(0.05)
-        tail_losses = pnl_series[pnl_series < var_95]
+        var_95 = np.quantile(pnl, 0.05)
+        tail_losses = pnl[pnl < var_95]
         expected_shortfall = tail_losses.mean() if len(tail_losses) > 0 else var_95
 
+        # Sample standard deviation (undefined for a single observation)
+        pnl_std = pnl.std(ddof=1) if len(pnl) > 1 else 0.0
+
+        # Drawdown from the running peak
+        max_drawdown = (pnl - np.maximum.accumulate(pnl)).min()
+
         return {
             'current_delta': self.position.net_delta(),
             'gamma_risk': self.position.gamma_risk(),
             'inventory_pct': (abs(self.position.etf_inventory) / self.max_inventory) * 100,
             'var_95': var_95,  # 5th percentile loss
             'expected_shortfall': expected_shortfall,
-            'max_drawdown': (pnl_series - pnl_series.cummax()).min(),
-            'sharpe_ratio': pnl_series.mean() / pnl_series.std() if pnl_series.std() > 0 else 0
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': pnl.mean() / pnl_std if pnl_std > 0 else 0
         }
 
 
+# Compiled eagerly for the float64 and float32 (Monte Carlo sweep) array
+# signatures; with cache=True the machine code is reused from __pycache__
+_SIMULATE_CORE_SIGNATURE = ('({0}[:], {0}[:], {0}[:], boolean[:], int64[:], boolean[:], '
+                            'float64, int64, float64, float64, float64, float64)')
+
+
+@njit([_SIMULATE_CORE_SIGNATURE.format('float64'),
+       _SIMULATE_CORE_SIGNATURE.format('float32')], cache=True)
+def _simulate_core(prices, vols, quote_bps, withdraw, flows, can_hedge, fair_value, max_inv,
+                   initial_capital, half_spread_per_bps, limit_half_spread_per_vol,
+                   skew_per_share):
+    """
+    Path-dependent core of simulate_market_maker_crisis.
+
+    Replays quote_market (FULL / NONE hedge states), execute_trade and
+    mark_to_market in a single pass on plain scalars; the position lives
+    in local variables for the whole replay. A missing quote side is NaN,
+    a withdrawn bar has NaN spread_bps, and a missing hedge entry price
+    is 0.0.
+
+    Args:
+        prices: ETF market price per bar, used for mark-to-market
+        vols: Volatility per bar (float64)
+        quote_bps: Spread to quote per bar when not near the inventory limit
+        withdraw: Whether quotes are withdrawn per bar (no hedge, panic vol)
+        flows: Net order flow per bar (int64, + = buy, - = sell)
+        can_hedge: Hedge availability per bar (bool)
+        fair_value: Fair value used for quoting and hedging
+        max_inv: Maximum inventory in shares
+        initial_capital: Starting capital (for return calculation)
+        half_spread_per_bps: Half-spread in dollars per bp of spread
+        limit_half_spread_per_vol: Near-limit half-spread per unit of volatility
+        skew_per_share: Quote skew in dollars per share of inventory
+
+    The scalar arguments are loop-invariant and precomputed by the caller,
+    so the loop body only multiplies and adds. Output price/P&L arrays use
+    the dtype of `prices`; the running position is always float64.
+
+    Returns:
+        Tuple of per-bar arrays (spread_bps, bid, ask, active, withdrawn,
+        traded, inventory, hedge, pnl, return_pct), recorded after the bar's trade,
+        followed by the final (entry_price, hedge_entry_price, active)
+    """
+    n = vols.shape[0]
+    out_dtype = prices.dtype
+    spread_bps = np.empty(n, dtype=out_dtype)
+    bid = np.empty(n, dtype=out_dtype)
+    ask = np.empty(n, dtype=out_dtype)
+    active = np.empty(n, dtype=np.bool_)
+    withdrawn = np.zeros(n, dtype=np.bool_)
+    traded = np.zeros(n, dtype=np.bool_)
+    inventory = np.empty(n, dtype=np.int64)
+    hedge = np.empty(n, dtype=np.int64)
+    pnl = np.empty(n, dtype=out_dtype)
+    return_pct = np.empty(n, dtype=out_dtype)
+
+    inv = 0
+    entry = 0.0
+    hedge_pos = 0
+    hedge_px = 0.0
+    is_active = True
+    near_limit = max_inv * 0.9
+
+    for i in range(n):
+        vol = vols[i]
+        b = np.nan
+        a = np.nan
+        # Explicit sign tests instead of abs() compile to branch-free selects
+        abs_inv = inv if inv >= 0 else -inv
+
+        # Quote (see quote_market)
+        if abs_inv > near_limit:
+            # Near limit - quote only the side that reduces inventory
+            half_spread = limit_half_spread_per_vol * vol
+            if inv > 0:
+                a = fair_value + half_spread
+            else:
+                b = fair_value - half_spread
+            spread_bps[i] = vol * 5 * 10000
+        elif withdraw[i]:
+            # Cannot hedge in a panic - withdraw quotes
+            is_active = False
+            withdrawn[i] = True
+            spread_bps[i] = np.nan
+        else:
+            bps = quote_bps[i]
+            half_spread = half_spread_per_bps * bps
+            skew = skew_per_share * inv
+            b = fair_value - half_spread - skew
+            a = fair_value + half_spread - skew
+            spread_bps[i] = bps
+
+        # Trade against incoming flow (see execute_trade)
+        flow = flows[i]
+        price = np.nan
+        if flow < 0 and b == b and b != 0.0:
+            price = b
+        elif flow > 0 and a == a and a != 0.0:
+            price = a
+
+        if price == price:
+            mm_size = -flow
+            new_inv = inv + mm_size
+            abs_new_inv = new_inv if new_inv >= 0 else -new_inv
+            if abs_new_inv <= max_inv:
+                if new_inv == 0:
+                    entry = 0.0
+                elif (inv > 0 and new_inv < 0) or (inv < 0 and new_inv > 0):
+                    entry = price
+                elif abs_new_inv > abs_inv:
+                    entry = (inv * entry + mm_size * price) / new_inv
+                inv = new_inv
+
+                if can_hedge[i]:
+                    new_hedge = -inv
+                    if new_hedge == 0:
+                        hedge_pos = 0
+                        hedge_px = 0.0
+                    elif new_hedge != hedge_pos:
+                        if hedge_px != 0.0 and hedge_pos != 0:
+                            hedge_px = (hedge_pos * hedge_px
+                                        + (new_hedge - hedge_pos) * fair_value) / new_hedge
+                        else:
+                            hedge_px = fair_value
+                        hedge_pos = new_hedge
+
+                traded[i] = True
+
+        # Mark to market (see mark_to_market)
+        total_pnl = inv * (prices[i] - entry)
+        if hedge_px != 0.0:
+            total_pnl += hedge_pos * (fair_value - hedge_px)
+
+        bid[i] = b
+        ask[i] = a
+        active[i] = is_active
+        inventory[i] = inv
+        hedge[i] = hedge_pos
+        pnl[i] = total_pnl
+        return_pct[i] = (total_pnl / initial_capital) * 100
+
+    return (spread_bps, bid, ask, active, withdrawn, traded, inventory, hedge, pnl,
+            return_pct, entry, hedge_px, is_active)
+
+
+@njit(parallel=True, cache=True)
+def _simulate_batch(prices, vols, quote_bps, withdraw, flows, can_hedge, fair_value,
+                    max_inv, initial_capital, half_spread_per_bps,
+                    limit_half_spread_per_vol, skew_per_share):
+    """
+    Run _simulate_core over independent scenarios (one per row), in parallel.
+
+    Returns:
+        Tuple of (pnl, inventory, active) arrays of shape (n_scenarios, n_bars)
+    """
+    n_scenarios, n = prices.shape
+    pnl = np.empty((n_scenarios, n), dtype=prices.dtype)
+    inventory = np.empty((n_scenarios, n), dtype=np.int64)
+    active = np.empty((n_scenarios, n), dtype=np.bool_)
+
+    for s in prange(n_scenarios):
+        result = _simulate_core(prices[s], vols[s], quote_bps[s], withdraw[s], flows[s],
+                                can_hedge[s], fair_value, max_inv, initial_capital,
+                                half_spread_per_bps, limit_half_spread_per_vol,
+                                skew_per_share)
+        active[s] = result[3]
+        inventory[s] = result[6]
+        pnl[s] = result[8]
+
+    return pnl, inventory, active
+
+
+def _crisis_kernel_inputs(
+    mm: MarketMakerSimulator,
+    fair_value: float,
+    can_hedge: np.ndarray,
+    vols: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, Tuple]:
+    """
+    Precompute the inputs of _simulate_core that do not depend on inventory.
+
+    Args:
+        mm: Simulator providing the market maker parameters
+        fair_value: Fair value used for quoting and hedging
+        can_hedge: Hedge availability per bar (any shape)
+        vols: Volatility per bar (same shape, float32 or float64)
+
+    Returns:
+        Tuple of (quote_bps, withdraw, scalars) where scalars are the
+        trailing scalar arguments of _simulate_core
+    """
+    # Spreads and withdrawals for every bar via hedge-code lookup tables.
+    # Codes are built in int8 directly (no int64 temporary for large batches)
+    hedge_code = np.full(can_hedge.shape, _HEDGE_NONE, dtype=np.int8)
+    hedge_code[can_hedge] = _HEDGE_FULL
+    quote_bps = (mm.target_spread_bps * _SPREAD_MULT[hedge_code]
+                 * (1 + _VOL_WIDENING[hedge_code] * (vols / 0.20))).astype(vols.dtype, copy=False)
+    withdraw = (hedge_code == _HEDGE_NONE) & (vols > 0.50)
+
+    # Loop-invariant quote terms are computed once here:
+    # $ per bp of spread, near-limit $ per unit of vol, skew $ per share
+    scalars = (
+        float(fair_value), int(mm.max_inventory), float(mm.initial_capital),
+        fair_value / 10000 / 2,
+        fair_value * 5 / 2,
+        fair_value * (50 / mm.max_inventory / 10000)
+    )
+    return quote_bps, withdraw, scalars
+
+
 def simulate_market_maker_crisis(
     fair_value: float,
     crisis_scenario: Dict,
-    mm_params: Optional[Dict] = None
+    mm_params: Optional[Dict] = None,
+    dtype: type = np.float64
 ) -> Tuple[MarketMakerSimulator, pd.DataFrame]:
     """
     Simulate market maker behavior through crisis.
@@ -497,9 +930,14 @@ def simulate_market_maker_crisis(
             - 'volatility': Volatility at each time
             - 'order_flow': Net buying/selling pressure at each time
         mm_params: Optional market maker parameters
+        dtype: Float dtype of the price, spread and P&L arrays. np.float32
+            halves memory traffic for large scenario sweeps at the cost of
+            precision (the running position is always tracked in float64)
 
     Returns:
-        Tuple of (MarketMakerSimulator instance, DataFrame with results)
+        Tuple of (MarketMakerSimulator instance, DataFrame with results).
+        spread_bps is NaN on bars where quotes were withdrawn (flagged in
+        the boolean withdrawn column).
 
     Examples:
         >>> scenario = {
@@ -519,46 +957,128 @@ def simulate_market_maker_crisis(
         **mm_params
     )
 
-    results = []
+    timeline = crisis_scenario['timeline']
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
 
-    for i, timestamp in enumerate(crisis_scenario['timeline']):
-        etf_price = crisis_scenario['etf_prices'][i]
-        can_hedge = crisis_scenario['hedge_availability'][i]
-        vol = crisis_scenario['volatility'][i]
-        flow = crisis_scenario['order_flow'][i]
+    etf_prices = np.asarray(crisis_scenario['etf_prices'], dtype=dtype)
+    can_hedge = np.asarray(crisis_scenario['hedge_availability'], dtype=bool)
+    vols = np.asarray(crisis_scenario['volatility'], dtype=dtype)
+    flows = np.asarray(crisis_scenario['order_flow'], dtype=np.int64)
 
-        # Determine hedge status
-        if can_hedge:
-            hedge_status = HedgeStatus.FULL
-        else:
-            hedge_status = HedgeStatus.NONE
-
-        # Get quote
-        quote = mm.quote_market(fair_value, hedge_status, vol)
-
-        # Process order flow
-        if quote and flow != 0:
-            side = 'buy' if flow > 0 else 'sell'
-            size = abs(flow)
-
-            if quote['bid'] and side == 'sell':
-                mm.execute_trade(size, quote['bid'], side, fair_value, can_hedge)
-            elif quote['ask'] and side == 'buy':
-                mm.execute_trade(size, quote['ask'], side, fair_value, can_hedge)
-
-        # Mark to market
-        pnl = mm.mark_to_market(etf_price)
-
-        results.append({
-            'timestamp': timestamp,
-            'etf_price': etf_price,
-            'fair_value': fair_value,
-            'discount_pct': ((etf_price / fair_value) - 1) * 100,
-            'spread_bps': quote['spread_bps'] if quote else np.inf,
-            'mm_active': mm.active,
-            'inventory': mm.position.etf_inventory,
-            'pnl': pnl['total_pnl'],
-            'cumulative_return_pct': pnl['return_pct']
-        })
+    quote_bps, withdraw, scalars = _crisis_kernel_inputs(mm, fair_value, can_hedge, vols)
+    (spread_bps, bid, ask, mm_active, withdrawn, traded, inventory, hedge, pnl,
+     return_pct, entry_price, hedge_entry, active) = _simulate_core(
+        etf_prices, vols, quote_bps, withdraw, flows, can_hedge, *scalars
+    )
+
+    # Store final state back on the simulator
+    timestamps = np.asarray(timeline, dtype='datetime64[ns]')
+    position = mm.position
+    mm.active = bool(active)
+    position.etf_entry_price = float(entry_price)
+    position.hedge_entry_price = float(hedge_entry) if hedge_entry else None
+    if len(inventory):
+        position.etf_inventory = int(inventory[-1])
+        position.underlying_hedge = int(hedge[-1])
+    if traded.any():
+        position.fair_value = fair_value
+        position.timestamp = pd.Timestamp(timestamps[traded][-1])
+
+    trade_price = np.where(flows < 0, bid, ask)
+    mm._append_positions(timestamps[traded], inventory[traded], hedge[traded],
+                         fair_value, trade_price[traded])
+    mm._append_pnl(timestamps, pnl)
+
+    results = pd.DataFrame({
+        'timestamp': timeline,
+        'etf_price': etf_prices,
+        'fair_value': fair_value,
+        'discount_pct': ((etf_prices / fair_value) - 1) * 100,
+        'spread_bps': spread_bps,
+        'mm_active': mm_active,
+        'withdrawn': withdrawn,
+        'inventory': inventory,
+        'pnl': pnl,
+        'cumulative_return_pct': return_pct
+    })
+
+    return mm, results
+
+
+def simulate_market_maker_crisis_batch(
+    fair_value: float,
+    etf_prices: np.ndarray,
+    volatility: np.ndarray,
+    hedge_availability: np.ndarray,
+    order_flow: np.ndarray,
+    mm_params: Optional[Dict] = None,
+    dtype: type = np.float64
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate many independent crisis scenarios at once.
+
+    Each row of the input matrices is one scenario, replayed exactly as
+    simulate_market_maker_crisis would. Scenarios run in parallel across
+    CPU cores when numba is installed.
+
+    Args:
+        fair_value: Fair value (NAV/iNAV) shared by all scenarios
+        etf_prices: ETF market prices, shape (n_scenarios, n_bars)
+        volatility: Volatility, same shape
+        hedge_availability: Boolean hedge availability, same shape
+        order_flow: Net order flow in shares, same shape
+        mm_params: Optional market maker parameters
+        dtype: Float dtype of the price and P&L arrays (float32 or float64)
+
+    Returns:
+        Dictionary of (n_scenarios, n_bars) arrays:
+            - pnl: Mark-to-market P&L
+            - inventory: ETF inventory
+            - mm_active: Whether the market maker is still quoting
+
+    Raises:
+        ValueError: If inputs are not 2-D arrays of the same shape
+
+    Examples:
+        >>> rng = np.random.default_rng(0)
+        >>> prices = 200 + np.cumsum(rng.normal(0, 1, (1000, 390)), axis=1)
+        >>> results = simulate_market_maker_crisis_batch(
+        ...     200.0, prices, np.full(prices.shape, 0.3),
+        ...     rng.random(prices.shape) > 0.2,
+        ...     rng.integers(-5000, 5000, prices.shape))
+        >>> results['pnl'][:, -1]  # Final P&L of every scenario
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+
+    prices = np.ascontiguousarray(etf_prices, dtype=dtype)
+    vols = np.ascontiguousarray(volatility, dtype=dtype)
+    can_hedge = np.ascontiguousarray(hedge_availability, dtype=bool)
+    flows = np.ascontiguousarray(order_flow, dtype=np.int64)
+
+    if prices.ndim != 2:
+        raise ValueError(f"etf_prices must be 2-D (n_scenarios, n_bars), got shape {prices.shape}")
+    for name, values in [('volatility', vols), ('hedge_availability', can_hedge),
+                         ('order_flow', flows)]:
+        if values.shape != prices.shape:
+            raise ValueError(f"{name} shape {values.shape} does not match "
+                             f"etf_prices shape {prices.shape}")
+
+    mm_params = mm_params or {}
+    mm = MarketMakerSimulator(
+        symbol='ETF',
+        **mm_params
+    )
+    quote_bps, withdraw, scalars = _crisis_kernel_inputs(mm, fair_value, can_hedge, vols)
+    pnl, inventory, mm_active = _simulate_batch(
+        prices, vols, quote_bps, withdraw, flows, can_hedge, *scalars
+    )
 
-    return mm, pd.DataFrame(results)
+    return {
+        'pnl': pnl,
+        'inventory': inventory,
+        'mm_active': mm_active
+    }
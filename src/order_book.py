@@ -3,23 +3,143 @@ Order Book Simulation
 
 Simulates order book mechanics to demonstrate how market orders execute during
 the August 24, 2015 flash crash, including "air pockets" and stop-loss cascades.
+
+The stop-loss cascade runs in a numba-compiled kernel when numba is
+installed and as plain Python otherwise (same results, slower).
 """
 
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass, field
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba not installed - kernels run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 @dataclass
 class Order:
     """Represents a limit order in the order book."""
+    # Fixed attribute layout (no per-instance __dict__); declared by hand
+    # rather than dataclass(slots=True) to keep Python < 3.10 support
+    __slots__ = ('price', 'size')
+
     price: float
     size: int
 
     def __post_init__(self):
-        if self.price <= 0:
-            raise ValueError("Price must be non-negative")
-        if self.size <= 0:
-            raise ValueError("Size must be greater than zero")
+        _validate_order(self.price, self.size)
+
+
+def _validate_order(price: float, size: int) -> None:
+    """Check the price and size of a new order (shared by Order and OrderBook)."""
+    if price <= 0:
+        raise ValueError("Price must be non-negative")
+    if size <= 0:
+        raise ValueError("Size must be greater than zero")
+
+
+def _trusted_orders(prices: List[float], sizes: List[int]) -> List[Order]:
+    """
+    Build Orders from levels already in the book, skipping validation.
+
+    Book contents were validated on the way in, so the snapshot views do
+    not pay for __post_init__ on every level.
+    """
+    orders = []
+    for price, size in zip(prices, sizes):
+        order = object.__new__(Order)
+        order.price = price
+        order.size = size
+        orders.append(order)
+    return orders
+
+
+def _insert_level(keys: np.ndarray, sizes: np.ndarray, n: int, i: int,
+                  key: float, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Insert one price level (sort key and size) at position i of the first n entries.
+
+    Buffers grow geometrically when full; the (possibly new) buffers are
+    returned.
+    """
+    if n == len(keys):
+        capacity = max(16, 2 * n)
+        new_keys = np.empty(capacity, dtype=np.float64)
+        new_sizes = np.empty(capacity, dtype=np.int64)
+        new_keys[:n] = keys[:n]
+        new_sizes[:n] = sizes[:n]
+        keys, sizes = new_keys, new_sizes
+    keys[i + 1:n + 1] = keys[i:n]
+    sizes[i + 1:n + 1] = sizes[i:n]
+    keys[i] = key
+    sizes[i] = size
+    return keys, sizes
+
+
+def _sweep_levels(sizes: np.ndarray, n: int, size: int) -> Tuple[int, int, int]:
+    """
+    Work out how a market order of `size` shares walks one book side.
+
+    Levels are the first n entries of `sizes`, best level last. One cumulative
+    sum and one binary search replace a per-level loop.
+
+    Returns:
+        Tuple of (levels fully consumed, shares taken from the next level,
+        shares left unfilled)
+    """
+    cum = np.cumsum(sizes[:n][::-1])
+    total = int(cum[-1]) if n else 0
+    if total <= size:
+        return n, 0, size - total
+    n_full = int(np.searchsorted(cum, size, side='right'))
+    partial = size - (int(cum[n_full - 1]) if n_full else 0)
+    return n_full, partial, 0
+
+
+def _level_fills(keys: np.ndarray, sizes: np.ndarray, n: int, n_full: int,
+                 partial: int, sign: float = 1.0) -> List[Tuple[float, int]]:
+    """
+    Build the (price, quantity) fill list for a sweep of the best levels.
+
+    Prices are sign * keys (-1 for the ask side, which stores -price).
+    """
+    n_traded = n_full + (1 if partial else 0)
+    best_prices = (sign * keys[n - n_traded:n][::-1]).tolist()
+    quantities = sizes[n - n_full:n][::-1].tolist()
+    if partial:
+        quantities.append(partial)
+    # Both lists have exactly n_traded entries, so the fill list is built
+    # at its final length in one step
+    return list(zip(best_prices, quantities))
+
+
+def _sorted_side(side: str, prices, sizes,
+                 descending: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Validate one side of a pre-sorted book and return it as arrays."""
+    prices = np.asarray(prices, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.int64)
+    if prices.ndim != 1 or prices.shape != sizes.shape:
+        raise ValueError(f"{side} prices and sizes must be 1-D and the same length")
+    if np.any(prices <= 0):
+        raise ValueError("Price must be non-negative")
+    if np.any(sizes <= 0):
+        raise ValueError("Size must be greater than zero")
+    steps = np.diff(prices)
+    if np.any(steps > 0 if descending else steps < 0):
+        raise ValueError(f"{side} prices must be sorted {'highest' if descending else 'lowest'} first")
+    return prices, sizes
 
 
 class OrderBook:
@@ -33,6 +153,14 @@ class OrderBook:
         bids: List of buy orders (price, size), sorted high to low
         asks: List of sell orders (price, size), sorted low to high
 
+    Internally each side is a pair of parallel NumPy arrays (float64 sort
+    keys, int64 sizes) in ascending key order. The key is the price for bids
+    and -price for asks. This puts the best price last on both sides: fills
+    consume from the end without shifting the rest of the book, and inserts
+    on either side are one searchsorted call. bids/asks build
+    Order lists from these arrays on access; they are snapshots, and
+    changing them does not change the book.
+
     Example:
         >>> book = OrderBook()
         >>> book.add_bid(100.0, 1000)
@@ -41,10 +169,113 @@ class OrderBook:
         0.10
     """
 
+    # One display_book row: bid price, bid size | ask price, ask size
+    _ROW = "{:>10} {:>10} | {:>10} {:>10}"
+
     def __init__(self):
         """Initialize an empty order book."""
-        self.bids: List[Order] = []  # Buy orders (highest price first)
-        self.asks: List[Order] = []  # Sell orders (lowest price first)
+        # Buy orders, ascending price (highest price last)
+        self._bid_prices = np.empty(0, dtype=np.float64)
+        self._bid_sizes = np.empty(0, dtype=np.int64)
+        self._n_bids = 0
+        # Sell orders keyed by -price, ascending (lowest price last)
+        self._ask_keys = np.empty(0, dtype=np.float64)
+        self._ask_sizes = np.empty(0, dtype=np.int64)
+        self._n_asks = 0
+        # Cached top of book (-inf / inf when the side is empty)
+        self._best_bid = -np.inf
+        self._best_ask = np.inf
+
+    @classmethod
+    def from_sorted_arrays(cls,
+                           bid_prices, bid_sizes,
+                           ask_prices=(), ask_sizes=()) -> 'OrderBook':
+        """
+        Build a book in one step from price levels that are already sorted.
+
+        Skips the per-order insert path; levels are copied straight into
+        the book's arrays. Within equal prices, earlier entries have time
+        priority.
+
+        Args:
+            bid_prices: Bid prices, highest first
+            bid_sizes: Bid sizes matching bid_prices
+            ask_prices: Ask prices, lowest first
+            ask_sizes: Ask sizes matching ask_prices
+
+        Returns:
+            New OrderBook
+
+        Raises:
+            ValueError: If a side is unsorted, mismatched in length, or has
+                non-positive prices or sizes
+
+        Example:
+            >>> book = OrderBook.from_sorted_arrays([100.0, 99.0], [500, 300],
+            ...                                     [101.0], [400])
+            >>> book.get_spread()
+            1.0
+        """
+        bid_prices, bid_sizes = _sorted_side('bid', bid_prices, bid_sizes, descending=True)
+        ask_prices, ask_sizes = _sorted_side('ask', ask_prices, ask_sizes, descending=False)
+
+        # Stored ascending by key with the best level last
+        book = cls()
+        book._bid_prices = bid_prices[::-1].copy()
+        book._bid_sizes = bid_sizes[::-1].copy()
+        book._set_bid_depth(len(bid_prices))
+        book._ask_keys = -ask_prices[::-1]
+        book._ask_sizes = ask_sizes[::-1].copy()
+        book._set_ask_depth(len(ask_prices))
+        return book
+
+    def copy(self) -> 'OrderBook':
+        """
+        Return an independent copy of the book.
+
+        Only the live price levels are copied (four array slices), so a
+        scenario sweep can build one book and hand each run a fresh copy
+        instead of rebuilding it order by order.
+
+        Example:
+            >>> base = OrderBook.from_sorted_arrays([99.0, 98.0], [200, 150])
+            >>> for stops in [[98.5], [97.0]]:
+            ...     simulate_stop_loss_cascade(100.0, stops, [300], base.copy())
+        """
+        book = OrderBook.__new__(OrderBook)
+        book._bid_prices = self._bid_prices[:self._n_bids].copy()
+        book._bid_sizes = self._bid_sizes[:self._n_bids].copy()
+        book._n_bids = self._n_bids
+        book._ask_keys = self._ask_keys[:self._n_asks].copy()
+        book._ask_sizes = self._ask_sizes[:self._n_asks].copy()
+        book._n_asks = self._n_asks
+        book._best_bid = self._best_bid
+        book._best_ask = self._best_ask
+        return book
+
+    def _set_bid_depth(self, n: int) -> None:
+        """Set the number of bid levels and refresh the cached best bid."""
+        self._n_bids = n
+        self._best_bid = float(self._bid_prices[n - 1]) if n else -np.inf
+
+    def _set_ask_depth(self, n: int) -> None:
+        """Set the number of ask levels and refresh the cached best ask."""
+        self._n_asks = n
+        self._best_ask = -float(self._ask_keys[n - 1]) if n else np.inf
+
+    @property
+    def bids(self) -> List[Order]:
+        """Buy orders, highest price first."""
+        n = self._n_bids
+        return _trusted_orders(self._bid_prices[:n][::-1].tolist(),
+                               self._bid_sizes[:n][::-1].tolist())
+
+    @property
+    def asks(self) -> List[Order]:
+        """Sell orders, lowest price first."""
+        n = self._n_asks
+        return _trusted_orders((-self._ask_keys[:n][::-1]).tolist(),
+                               self._ask_sizes[:n][::-1].tolist())
 
     def add_bid(self, price: float, size: int) -> None:
         """
@@ -54,10 +285,16 @@ class OrderBook:
             price: Bid price
             size: Number of shares
         """
-        order = Order(price, size)
-        self.bids.append(order)
-        # Keep bids sorted by price (highest first)
-        self.bids.sort(key=lambda x: x.price, reverse=True)
+        _validate_order(price, size)
+        n = self._n_bids
+        # Keep bids sorted by price (highest last); equal prices keep
+        # time priority, so the new order goes behind existing ones
+        i = int(np.searchsorted(self._bid_prices[:n], price, side='left'))
+        self._bid_prices, self._bid_sizes = _insert_level(
+            self._bid_prices, self._bid_sizes, n, i, price, size)
+        self._n_bids = n + 1
+        if i == n:
+            self._best_bid = float(price)
 
     def add_ask(self, price: float, size: int) -> None:
         """
@@ -67,10 +304,15 @@ class OrderBook:
             price: Ask price
             size: Number of shares
         """
-        order = Order(price, size)
-        self.asks.append(order)
-        # Keep asks sorted by price (lowest first)
-        self.asks.sort(key=lambda x: x.price)
+        _validate_order(price, size)
+        n = self._n_asks
+        # Keep asks sorted by price (lowest last), time priority within a price
+        i = int(np.searchsorted(self._ask_keys[:n], -price, side='left'))
+        self._ask_keys, self._ask_sizes = _insert_level(
+            self._ask_keys, self._ask_sizes, n, i, -price, size)
+        self._n_asks = n + 1
+        if i == n:
+            self._best_ask = float(price)
 
     def execute_market_buy(self, size: int) -> List[Tuple[float, int]]:
         """
@@ -98,22 +340,12 @@ class OrderBook:
         if size <= 0:
             raise ValueError("Order size must be positive")
 
-        fills = []
-        remaining = size
-
-        while remaining > 0 and self.asks:
-            best_ask = self.asks[0]
-
-            if remaining >= best_ask.size:
-                # Take entire level
-                fills.append((best_ask.price, best_ask.size))
-                remaining -= best_ask.size
-                self.asks.pop(0)
-            else:
-                # Partial fill
-                fills.append((best_ask.price, remaining))
-                self.asks[0].size -= remaining
-                remaining = 0
+        n = self._n_asks
+        n_full, partial, remaining = _sweep_levels(self._ask_sizes, n, size)
+        fills = _level_fills(self._ask_keys, self._ask_sizes, n, n_full, partial, sign=-1.0)
+        if partial:
+            self._ask_sizes[n - 1 - n_full] -= partial
+        self._set_ask_depth(n - n_full)
 
         if remaining > 0:
             raise ValueError(
@@ -146,25 +378,52 @@ class OrderBook:
             >>> fills = book.execute_market_sell(800)
             >>> # Fills at 100.0 for 500 shares, then 99.0 for 300 shares
         """
-        if size <= 0:
-            raise ValueError("Order size must be positive")
+        n, n_full, partial = self._take_bids(size)
+        return _level_fills(self._bid_prices, self._bid_sizes, n, n_full, partial)
 
-        fills = []
-        remaining = size
+    def _execute_market_sell_agg(self, size: int) -> Tuple[float, int, int]:
+        """
+        Execute a market sell like execute_market_sell, returning only totals.
 
-        while remaining > 0 and self.bids:
-            best_bid = self.bids[0]
+        For callers that need the average price but not each fill, so no
+        fill list is built.
 
-            if remaining >= best_bid.size:
-                # Take entire level
-                fills.append((best_bid.price, best_bid.size))
-                remaining -= best_bid.size
-                self.bids.pop(0)
-            else:
-                # Partial fill
-                fills.append((best_bid.price, remaining))
-                self.bids[0].size -= remaining
-                remaining = 0
+        Returns:
+            Tuple of (total_value, total_qty, n_levels) where n_levels is the
+            number of price levels traded
+        """
+        n, n_full, partial = self._take_bids(size)
+        # total_qty is the order size by construction: an order that cannot
+        # be filled raises, so there is no second pass to count shares
+        assert int(self._bid_sizes[n - n_full:n].sum()) + partial == size
+        best_prices = self._bid_prices[:n][::-1]
+        total_value = float(np.dot(best_prices[:n_full], self._bid_sizes[:n][::-1][:n_full]))
+        if partial:
+            total_value += float(best_prices[n_full]) * partial
+        return total_value, size, n_full + (1 if partial else 0)
+
+    def _take_bids(self, size: int) -> Tuple[int, int, int]:
+        """
+        Remove `size` shares from the best bids.
+
+        Consumed levels stay in the arrays past the new depth, so fills can
+        still be read from them afterwards.
+
+        Returns:
+            Tuple of (depth before the sell, levels fully consumed, shares
+            taken from the next level)
+
+        Raises:
+            ValueError: If size is not positive or liquidity runs out
+        """
+        if size <= 0:
+            raise ValueError("Order size must be positive")
+
+        n = self._n_bids
+        n_full, partial, remaining = _sweep_levels(self._bid_sizes, n, size)
+        if partial:
+            self._bid_sizes[n - 1 - n_full] -= partial
+        self._set_bid_depth(n - n_full)
 
         if remaining > 0:
             raise ValueError(
@@ -172,7 +431,7 @@ class OrderBook:
                 f"This is an 'air pocket' where bids disappeared."
             )
 
-        return fills
+        return n, n_full, partial
 
     def execute_limit_buy(self, size: int, price: float) -> List[Tuple[float, int]]:
         """
@@ -195,19 +454,26 @@ class OrderBook:
 
         fills = []
         remaining = size
-
-        while remaining > 0 and self.asks and self.asks[0].price <= price:
-            best_ask = self.asks[0]
-
-            if remaining >= best_ask.size:
-                fills.append((best_ask.price, best_ask.size))
-                remaining -= best_ask.size
-                self.asks.pop(0)
+        keys, sizes = self._ask_keys, self._ask_sizes
+        n = self._n_asks
+        limit = price
+        best_price = self._best_ask  # inf when there are no asks
+
+        while remaining > 0 and best_price <= limit:
+            best_size = int(sizes[n - 1])
+
+            if remaining >= best_size:
+                fills.append((best_price, best_size))
+                remaining -= best_size
+                n -= 1
+                best_price = -float(keys[n - 1]) if n else np.inf
             else:
-                fills.append((best_ask.price, remaining))
-                self.asks[0].size -= remaining
+                fills.append((best_price, remaining))
+                sizes[n - 1] = best_size - remaining
                 remaining = 0
 
+        self._set_ask_depth(n)
+
         # Add unfilled portion to book as resting limit order
         if remaining > 0:
             self.add_bid(price, remaining)
@@ -216,11 +482,11 @@ class OrderBook:
 
     def get_best_bid(self) -> Optional[float]:
         """Return highest bid price, or None if no bids."""
-        return self.bids[0].price if self.bids else None
+        return self._best_bid if self._n_bids else None
 
     def get_best_ask(self) -> Optional[float]:
         """Return lowest ask price, or None if no asks."""
-        return self.asks[0].price if self.asks else None
+        return self._best_ask if self._n_asks else None
 
     def get_midpoint(self) -> Optional[float]:
         """
@@ -229,20 +495,14 @@ class OrderBook:
         On August 24, wide spreads made midpoints unreliable for fair value.
         Example: Bid $50, Ask $70 → midpoint $60, but true value $72.
         """
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-
-        if best_bid is not None and best_ask is not None:
-            return (best_bid + best_ask) / 2
+        if self._n_bids and self._n_asks:
+            return (self._best_bid + self._best_ask) / 2
         return None
 
     def get_spread(self) -> Optional[float]:
         """Return bid-ask spread in dollars."""
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-
-        if best_bid is not None and best_ask is not None:
-            return best_ask - best_bid
+        if self._n_bids and self._n_asks:
+            return self._best_ask - self._best_bid
         return None
 
     def get_spread_bps(self, reference_price: Optional[float] = None) -> Optional[float]:
@@ -277,19 +537,27 @@ class OrderBook:
         """
         lines = ["Order Book:"]
         lines.append("-" * 40)
-        lines.append(f"{'Price':>10} {'Size':>10} | {'Price':>10} {'Size':>10}")
+        lines.append(self._ROW.format('Price', 'Size', 'Price', 'Size'))
         lines.append(f"{'BIDS':>20} | {'ASKS':>20}")
         lines.append("-" * 40)
 
-        for i in range(levels):
-            bid_price = f"{self.bids[i].price:.2f}" if i < len(self.bids) else ""
-            bid_size = f"{self.bids[i].size}" if i < len(self.bids) else ""
-            ask_price = f"{self.asks[i].price:.2f}" if i < len(self.asks) else ""
-            ask_size = f"{self.asks[i].size}" if i < len(self.asks) else ""
-
-            lines.append(
-                f"{bid_price:>10} {bid_size:>10} | {ask_price:>10} {ask_size:>10}"
-            )
+        # Format each column once from the best `levels` entries of each side
+        nb = min(levels, self._n_bids)
+        na = min(levels, self._n_asks)
+        bid_prices = self._bid_prices[self._n_bids - nb:self._n_bids][::-1].tolist()
+        bid_sizes = self._bid_sizes[self._n_bids - nb:self._n_bids][::-1].tolist()
+        ask_prices = (-self._ask_keys[self._n_asks - na:self._n_asks][::-1]).tolist()
+        ask_sizes = self._ask_sizes[self._n_asks - na:self._n_asks][::-1].tolist()
+
+        pad_bids = [""] * (levels - nb)
+        pad_asks = [""] * (levels - na)
+        lines.extend(map(
+            self._ROW.format,
+            [f"{p:.2f}" for p in bid_prices] + pad_bids,
+            [str(size) for size in bid_sizes] + pad_bids,
+            [f"{p:.2f}" for p in ask_prices] + pad_asks,
+            [str(size) for size in ask_sizes] + pad_asks
+        ))
 
         spread = self.get_spread()
         if spread is not None:
@@ -299,6 +567,91 @@ class OrderBook:
         return "\n".join(lines)
 
 
+@njit(cache=True)
+def _sell_into_bids(bid_prices, bid_sizes, top, size):
+    """
+    Market sell `size` shares into bids[:top] (best level last), in place.
+
+    Value is accumulated in a local with plain += in the same pass as the
+    walk. math.fsum-style compensated summation is deliberately not used
+    here: a cascade sums at most a few thousand price*qty terms, so its
+    extra accuracy is invisible next to the price moves being measured.
+
+    Returns:
+        Tuple of (new top, total value, shares filled); fewer shares than
+        `size` are filled only when the side runs out
+    """
+    remaining = size
+    value = 0.0
+    while remaining > 0 and top > 0:
+        level_size = bid_sizes[top - 1]
+        if remaining >= level_size:
+            value += bid_prices[top - 1] * level_size
+            remaining -= level_size
+            top -= 1
+        else:
+            value += bid_prices[top - 1] * remaining
+            bid_sizes[top - 1] = level_size - remaining
+            remaining = 0
+    return top, value, size - remaining
+
+
+@njit(cache=True)
+def _cascade_core(stop_prices, stop_sizes, bid_prices, bid_sizes, n_bids,
+                  initial_price, initial_sell_size):
+    """
+    Compiled core of simulate_stop_loss_cascade.
+
+    Args:
+        stop_prices: Trigger prices, highest first (float64)
+        stop_sizes: Order size per stop (int64)
+        bid_prices: Bid prices, ascending (best last); only [:n_bids] is used
+        bid_sizes: Bid sizes parallel to bid_prices, consumed in place
+        n_bids: Number of bid levels in the book
+        initial_price: Starting market price
+        initial_sell_size: Size of the sell that starts the cascade
+
+    Returns:
+        Tuple of (trigger prices, average execution prices) of the stops
+        that executed, and the number of bid levels left
+    """
+    n_stops = stop_prices.shape[0]
+    triggers = np.empty(n_stops, dtype=np.float64)
+    executions = np.empty(n_stops, dtype=np.float64)
+    n_exec = 0
+    top = n_bids
+    if n_stops == 0:
+        return triggers, executions, top
+
+    # Initial sell pressure that starts the cascade
+    current_price = initial_price
+    if current_price > stop_prices[0]:
+        top, value, filled = _sell_into_bids(bid_prices, bid_sizes, top, initial_sell_size)
+        if filled == initial_sell_size:
+            current_price = value / filled
+
+    # Stops are sorted highest first and, once one fires, every later stop
+    # fires too. So the cascade either starts at the first stop or never
+    # starts, and the stops and the bids are then consumed in one merged walk
+    # that shares the top-of-book index.
+    if current_price > stop_prices[0]:
+        return triggers[:0], executions[:0], top
+
+    for i in range(n_stops):
+        size = stop_sizes[i]
+        if size <= 0:
+            break
+        top, value, filled = _sell_into_bids(bid_prices, bid_sizes, top, size)
+        if filled < size:
+            # Ran out of liquidity (air pocket reached)
+            break
+        triggers[n_exec] = stop_prices[i]
+        executions[n_exec] = value / size
+        n_exec += 1
+
+    return triggers[:n_exec], executions[:n_exec], top
+
+
 def simulate_stop_loss_cascade(
     initial_price: float,
     stop_levels: List[float],
@@ -316,6 +669,8 @@ def simulate_stop_loss_cascade(
         stop_levels: List of stop-loss trigger prices
         order_sizes: List of order sizes for each stop level
         initial_book: Optional order book. If None, creates realistic sparse book.
+            The book is consumed by the cascade; pass initial_book.copy()
+            to run several scenarios against the same starting book.
 
     Returns:
         Dict with keys:
@@ -334,81 +689,81 @@ def simulate_stop_loss_cascade(
 
     # Create order book if not provided (sparse book with gaps)
     if initial_book is None:
-        initial_book = OrderBook()
         # Create sparse order book with limited depth and gaps
         # This simulates the "air pockets" of August 24, 2015
         # Limited liquidity at each level ensures price impact/slippage
-        initial_book.add_bid(initial_price - 1, 200)  # Limited depth
-        initial_book.add_bid(initial_price - 2, 150)
-        # Gap at initial_price - 3 (no bids)
-        initial_book.add_bid(initial_price - 4, 200)
-        initial_book.add_bid(initial_price - 5, 150)
-        # Gap at initial_price - 6
-        initial_book.add_bid(initial_price - 7, 200)
-        initial_book.add_bid(initial_price - 8, 150)
-        # Deeper levels with more gaps
-        initial_book.add_bid(initial_price - 10, 200)
-        initial_book.add_bid(initial_price - 12, 200)
-        initial_book.add_bid(initial_price - 15, 200)
+        # Gaps (no bids) at initial_price - 3, - 6, - 9, - 11, ...
+        offsets = np.array([1, 2, 4, 5, 7, 8, 10, 12, 15], dtype=np.float64)
+        sizes = np.array([200, 150, 200, 150, 200, 150, 200, 200, 200], dtype=np.int64)
+        initial_book = OrderBook.from_sorted_arrays(initial_price - offsets, sizes)
 
     # Combine and sort stops by trigger price (highest first)
-    stops = sorted(zip(stop_levels, order_sizes), key=lambda x: x[0], reverse=True)
+    stops = sorted(zip(stop_levels, order_sizes), key=itemgetter(0), reverse=True)
 
-    triggers = []
-    executions = []
-    slippage = []
-    slippage_pct = []
-    current_price = initial_price
+    stop_prices = np.array([stop for stop, _ in stops], dtype=np.float64)
+    stop_sizes = np.array([size for _, size in stops], dtype=np.int64)
 
-    # Simulate initial sell pressure that starts the cascade
-    # If price is above highest stop, execute a small sell to trigger first stop
-    if stops and current_price > stops[0][0]:
-        # Execute small sell to drop price below first stop
-        try:
-            initial_sell_size = 100  # Small sell to start cascade
-            fills = initial_book.execute_market_sell(initial_sell_size)
-            if fills:
-                total_value = sum(price * qty for price, qty in fills)
-                total_qty = sum(qty for _, qty in fills)
-                current_price = total_value / total_qty
-        except ValueError:
-            pass  # Not enough liquidity for initial sell
-
-    cascade_started = False
-
-    for trigger_price, size in stops:
-        # Stop triggers if price is at or below trigger, OR if cascade has started
-        # (simulating panic/momentum selling where all stops fire once cascade begins)
-        should_trigger = current_price <= trigger_price or cascade_started
-
-        if should_trigger:
-            cascade_started = True  # Once started, all remaining stops trigger
-            # Stop triggered, becomes market order
-            try:
-                fills = initial_book.execute_market_sell(size)
-                if not fills:
-                    # No fills but no exception - shouldn't happen but check anyway
-                    break
-
-                # Calculate average execution price
-                total_value = sum(price * qty for price, qty in fills)
-                total_qty = sum(qty for _, qty in fills)
-                avg_price = total_value / total_qty
-
-                triggers.append(trigger_price)
-                executions.append(avg_price)
-                slip = trigger_price - avg_price
-                slippage.append(slip)
-                slippage_pct.append((slip / trigger_price) * 100)
-
-                current_price = avg_price  # Update market price
-            except ValueError as e:
-                # Ran out of liquidity (air pocket reached)
-                break
+    # Stops become market sells against the bids, in a single compiled pass
+    triggers, executions, n_bids = _cascade_core(
+        stop_prices, stop_sizes,
+        initial_book._bid_prices, initial_book._bid_sizes, initial_book._n_bids,
+        float(initial_price), 100  # Small sell to start the cascade
+    )
+    initial_book._set_bid_depth(n_bids)
+    slippage = triggers - executions
 
     return {
-        'triggers': triggers,
-        'executions': executions,
-        'slippage': slippage,
-        'slippage_pct': slippage_pct
+        'triggers': triggers.tolist(),
+        'executions': executions.tolist(),
+        'slippage': slippage.tolist(),
+        'slippage_pct': ((slippage / triggers) * 100).tolist()
     }
+
+
+def _run_cascade_scenario(scenario: Dict, base_book: Optional[OrderBook]) -> Dict:
+    """Run one sweep scenario (module-level so process pools can pickle it)."""
+    book = scenario.get('initial_book', base_book)
+    return simulate_stop_loss_cascade(
+        scenario['initial_price'],
+        scenario['stop_levels'],
+        scenario['order_sizes'],
+        book.copy() if book is not None else None
+    )
+
+
+def sweep_cascades(
+    scenarios: List[Dict],
+    n_workers: Optional[int] = None,
+    base_book: Optional[OrderBook] = None
+) -> List[Dict]:
+    """
+    Run many stop-loss cascade scenarios, in parallel across processes.
+
+    Useful for slippage surfaces over (initial_price, stop_levels,
+    order_sizes). Scenarios are independent, so they scale with the number
+    of cores. Each run gets its own copy of the book; neither base_book nor
+    a scenario's initial_book is modified.
+
+    Args:
+        scenarios: List of dicts with keys initial_price, stop_levels,
+            order_sizes and optionally initial_book
+        n_workers: Number of worker processes (default: one per CPU).
+            Use 1 to run serially in this process.
+        base_book: Book used by scenarios without their own initial_book.
+            If None, those scenarios use the default sparse book.
+
+    Returns:
+        List of simulate_stop_loss_cascade results, in scenario order
+
+    Example:
+        >>> scenarios = [{'initial_price': 100.0, 'stop_levels': [99.0, 98.0],
+        ...               'order_sizes': [size, size]} for size in (100, 300, 500)]
+        >>> results = sweep_cascades(scenarios, n_workers=4)
+        >>> [r['slippage'] for r in results]
+    """
+    if n_workers == 1:
+        return [_run_cascade_scenario(scenario, base_book) for scenario in scenarios]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(_run_cascade_scenario, scenarios,
+                             [base_book] * len(scenarios)))
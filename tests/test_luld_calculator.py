@@ -7,6 +7,7 @@ and validates calculations against August 24, 2015 historical data.
 
 import pytest
 from datetime import datetime
+import pandas as pd
 import sys
 from pathlib import Path
 
@@ -17,7 +18,8 @@ sys.path.insert(0, str(src_path))
 from luld_calculator import (
     calculate_luld_bands,
     get_time_of_day_category,
-    analyze_flash_crash_halt
+    analyze_flash_crash_halt,
+    analyze_flash_crash_halt_df
 )
 
 
@@ -109,6 +111,14 @@ class TestCalculateLULDBands:
         assert upper == pytest.approx(130.00)
         assert pct == pytest.approx(0.30)
 
+    def test_repeated_queries_are_cached(self):
+        """Identical queries are served from the band cache."""
+        calculate_luld_bands.cache_clear()
+        first = calculate_luld_bands(75.50, tier=1, time_of_day='opening')
+        second = calculate_luld_bands(75.50, tier=1, time_of_day='opening')
+        assert first == second
+        assert calculate_luld_bands.cache_info().hits == 1
+
     def test_edge_case_exact_3_dollars(self):
         """Test stock exactly at $3.00 (should use above $3 bands)."""
         lower, upper, pct = calculate_luld_bands(3.00, tier=1, time_of_day='normal')
@@ -482,3 +492,58 @@ class TestLeveragedETPs:
         assert lower == pytest.approx(85.00)  # 5% * 3 = 15%
         assert upper == pytest.approx(115.00)
         assert pct == pytest.approx(0.15)
+
+
+class TestAnalyzeFlashCrashHaltDF:
+    """Tests for the DataFrame batch API."""
+
+    @pytest.fixture
+    def observations(self):
+        """Mixed observations covering every price range and time period."""
+        return pd.DataFrame({
+            'ticker': ['DVY', 'RSP', 'SPLV', 'SPY', 'PNY', 'LEV', 'TR2'],
+            'reference_price': [75.50, 76.80, 39.50, 197.00, 0.10, 100.00, 2.00],
+            'actual_price': [65.20, 43.77, 21.18, 200.00, 0.05, 130.00, 2.10],
+            'tier': [1, 1, 1, 1, 2, 1, 2],
+            'timestamp': [
+                datetime(2015, 8, 24, 9, 35, 0),
+                datetime(2015, 8, 24, 9, 38, 0),
+                datetime(2015, 8, 24, 9, 40, 0),
+                datetime(2015, 8, 24, 12, 0, 0),
+                datetime(2015, 8, 24, 9, 45, 0),
+                datetime(2015, 8, 24, 15, 35, 0),
+                datetime(2015, 8, 24, 16, 0, 0),
+            ],
+            'leverage': [1.0, 1.0, 1.0, 1.0, 1.0, 3.0, 2.0],
+        })
+
+    def test_matches_scalar_analysis(self, observations):
+        """Each row matches analyze_flash_crash_halt for the same inputs."""
+        result = analyze_flash_crash_halt_df(observations)
+
+        for i, row in observations.iterrows():
+            expected = analyze_flash_crash_halt(**row.to_dict())
+            actual = result.loc[i]
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    assert actual[key] == pytest.approx(value), key
+                else:
+                    assert actual[key] == value, key
+
+    def test_preserves_index(self, observations):
+        """Result is aligned with the input index."""
+        observations.index = [10, 20, 30, 40, 50, 60, 70]
+        result = analyze_flash_crash_halt_df(observations)
+        assert list(result.index) == [10, 20, 30, 40, 50, 60, 70]
+
+    def test_leverage_column_optional(self, observations):
+        """Leverage defaults to 1.0 when the column is absent."""
+        result = analyze_flash_crash_halt_df(observations.drop(columns='leverage'))
+        assert (result['leverage'] == 1.0).all()
+        assert result.loc[0, 'band_percentage'] == pytest.approx(10.0)
+
+    def test_invalid_row_raises_error(self, observations):
+        """Invalid inputs raise the same errors as the scalar API."""
+        observations.loc[3, 'reference_price'] = 0.0
+        with pytest.raises(ValueError, match="reference_price must be positive"):
+            analyze_flash_crash_halt_df(observations)
@@ -31,7 +31,9 @@ from market_maker_pnl import (
     HedgeStatus,
     MarketMakerPosition,
     MarketMakerSimulator,
-    simulate_market_maker_crisis
+    Quote,
+    simulate_market_maker_crisis,
+    simulate_market_maker_crisis_batch
 )
 
 
@@ -73,6 +75,12 @@ class TestMarketMakerPosition:
         delta = self.position.net_delta()
         assert delta == 0  # 10000 + (-10000) + 0 = 0
 
+    def test_position_has_no_instance_dict(self):
+        """Test that positions use slots rather than a per-instance __dict__"""
+        assert not hasattr(self.position, '__dict__')
+        with pytest.raises(AttributeError):
+            self.position.unknown_field = 1
+
     def test_net_delta_partial_hedge(self):
         """Test net delta with partial hedge"""
         self.position.underlying_hedge = -5000
@@ -166,6 +174,25 @@ class TestMarketMakerPosition:
         expected_pnl = 10000 * (105 - 100)
         assert abs(pnl - expected_pnl) < 0.01
 
+    def test_batch_inventory_pnl_matches_positions(self):
+        """Test batch P&L equals the sum of per-position inventory P&L"""
+        inventory = np.array([10000, -5000, 0, 2500])
+        entry = np.array([100.0, 50.0, 0.0, 80.0])
+        current = np.array([102.0, 49.0, 75.0, 70.0])
+
+        expected = sum(
+            MarketMakerPosition(
+                etf_inventory=int(inv), underlying_hedge=0, futures_hedge=0,
+                etf_entry_price=float(px), hedge_entry_price=None,
+                timestamp=self.timestamp, fair_value=0.0
+            ).inventory_risk_usd(float(cur))
+            for inv, px, cur in zip(inventory, entry, current)
+        )
+
+        result = MarketMakerPosition.batch_inventory_pnl(inventory, entry, current)
+        assert result == pytest.approx(expected)
+        assert result == pytest.approx(20000 + 5000 - 25000)
+
     def test_gamma_risk_calculation(self):
         """Test gamma risk estimation"""
         gamma = self.position.gamma_risk()
@@ -218,6 +245,17 @@ class TestMarketMakerSimulatorInit:
         assert mm.max_inventory == 50_000
         assert mm.target_spread_bps == 5.0
 
+    def test_initialization_history_size_preallocates(self):
+        """Test that history_size preallocates history without recording rows"""
+        mm = MarketMakerSimulator(symbol='SPY', history_size=500)
+
+        assert len(mm.pnl_history) == 0
+        assert len(mm.position_history) == 0
+
+        for price in range(600):
+            mm.mark_to_market(100.0 + price)
+        assert len(mm.pnl_history) == 600
+
     def test_initialization_invalid_capital(self):
         """Test that negative capital raises ValueError"""
         with pytest.raises(ValueError, match="initial_capital must be positive"):
@@ -269,11 +307,7 @@ class TestQuoteMarket:
         )
 
         assert quote is not None
-        assert 'bid' in quote
-        assert 'ask' in quote
-        assert 'bid_size' in quote
-        assert 'ask_size' in quote
-        assert 'spread_bps' in quote
+        assert quote._fields == ('bid', 'ask', 'bid_size', 'ask_size', 'spread_bps')
 
         # Spread should be around target (2 bps * (1 + 0.20/0.20) = 4 bps)
         expected_spread_bps = 2.0 * (1 + 0.20 / 0.20)
@@ -339,7 +373,7 @@ class TestQuoteMarket:
         assert quote['ask'] is not None  # Only offer to sell
         assert quote['bid_size'] == 0
         assert quote['ask_size'] > 0
-        assert quote['spread_bps'] == np.inf
+        assert quote['spread_bps'] == pytest.approx(0.20 * 5 * 10000)
 
     def test_quote_market_near_short_inventory_limit_bids_only(self):
         """Test that MM only bids when near short inventory limit"""
@@ -353,7 +387,7 @@ class TestQuoteMarket:
         assert quote['ask'] is None  # No offer
         assert quote['bid_size'] > 0
         assert quote['ask_size'] == 0
-        assert quote['spread_bps'] == np.inf
+        assert quote['spread_bps'] == pytest.approx(0.20 * 5 * 10000)
 
     def test_quote_market_at_inventory_limit_ask_size_limited(self):
         """Test that ask size is limited by inventory when at limit"""
@@ -365,6 +399,17 @@ class TestQuoteMarket:
         assert quote['ask_size'] <= abs(self.mm.position.etf_inventory)
         assert quote['ask_size'] == min(10000, abs(self.mm.position.etf_inventory))
 
+    def test_quote_market_returns_quote_tuple(self):
+        """Test that quotes are Quote tuples readable by field or by key"""
+        quote = self.mm.quote_market(200.0, HedgeStatus.FULL, 0.20)
+
+        assert isinstance(quote, Quote)
+        bid, ask, bid_size, ask_size, spread_bps = quote
+        assert quote['bid'] == quote.bid == bid
+        assert quote['spread_bps'] == quote.spread_bps == spread_bps
+        assert quote[0] == bid
+        assert quote[-1] == spread_bps
+
 
 class TestExecuteTrade:
     """Tests for execute_trade method"""
@@ -546,6 +591,18 @@ class TestExecuteTrade:
         assert record['fair_value'] == 200.0
         assert record['etf_price'] == 200.0
 
+    def test_position_history_df(self):
+        """Test that position history is available as a DataFrame"""
+        self.mm.execute_trade(1000, 200.0, 'sell', 200.0, True)
+        self.mm.execute_trade(500, 201.0, 'buy', 200.0, False)
+
+        df = self.mm.position_history_df
+        assert list(df.columns) == ['timestamp', 'etf_inventory', 'hedge_position',
+                                    'net_delta', 'fair_value', 'etf_price']
+        assert df['etf_inventory'].tolist() == [1000, 500]
+        assert df['net_delta'].tolist() == [0, -500]
+        assert df['etf_price'].tolist() == [200.0, 201.0]
+
     def test_execute_trade_updates_timestamp(self):
         """Test that position timestamp is updated"""
         old_timestamp = self.mm.position.timestamp
@@ -616,6 +673,34 @@ class TestMarkToMarket:
         # Net: 0 (perfectly hedged)
         assert abs(pnl['total_pnl']) < 0.01
 
+    def test_pnl_history_df(self):
+        """Test that P&L history is available as a DataFrame"""
+        self.mm.execute_trade(1000, 100.0, 'sell', 100.0, False)
+        self.mm.mark_to_market(105.0)
+        self.mm.mark_to_market(95.0)
+
+        df = self.mm.pnl_history_df
+        assert list(df.columns) == ['timestamp', 'etf_pnl', 'hedge_pnl',
+                                    'total_pnl', 'return_pct', 'capital']
+        assert df['total_pnl'].tolist() == [5000.0, -5000.0]
+        assert df['capital'].tolist() == [1_005_000.0, 995_000.0]
+        assert df['return_pct'].tolist() == pytest.approx([0.5, -0.5])
+
+    def test_mark_to_market_with_timestamp(self):
+        """Test that an explicit timestamp is recorded"""
+        ts = pd.Timestamp('2015-08-24 09:35')
+        pnl = self.mm.mark_to_market(200.0, timestamp=ts)
+
+        assert pnl['timestamp'] == ts
+        assert self.mm.pnl_history[-1]['timestamp'] == ts
+
+    def test_mark_to_market_without_timestamp(self):
+        """Test that no wall-clock timestamp is recorded by default"""
+        pnl = self.mm.mark_to_market(200.0)
+
+        assert pnl['timestamp'] is pd.NaT
+        assert self.mm.pnl_history[-1]['timestamp'] is pd.NaT
+
     def test_mark_to_market_updates_pnl_history(self):
         """Test that pnl_history is updated"""
         assert len(self.mm.pnl_history) == 0
@@ -749,6 +834,29 @@ class TestRiskMetrics:
         # Positive trend should have positive Sharpe
         assert 'sharpe_ratio' in metrics
 
+    def test_risk_metrics_match_pandas(self):
+        """Test that NumPy risk metrics agree with the pandas definitions"""
+        self.mm.execute_trade(10000, 100.0, 'sell', 100.0, can_hedge=False)
+
+        prices = [100, 102, 104, 98, 96, 103, 97, 101, 99, 105]
+        for price in prices:
+            self.mm.mark_to_market(float(price))
+
+        metrics = self.mm.calculate_risk_metrics()
+        pnl_series = pd.Series([p['total_pnl'] for p in self.mm.pnl_history])
+
+        assert metrics['var_95'] == pytest.approx(pnl_series.quantile(0.05))
+        assert metrics['max_drawdown'] == pytest.approx((pnl_series - pnl_series.cummax()).min())
+        assert metrics['sharpe_ratio'] == pytest.approx(pnl_series.mean() / pnl_series.std())
+
+    def test_risk_metrics_single_observation(self):
+        """Test that a single P&L snapshot gives a zero Sharpe ratio"""
+        self.mm.execute_trade(10000, 100.0, 'sell', 100.0, can_hedge=False)
+        self.mm.mark_to_market(101.0)
+
+        metrics = self.mm.calculate_risk_metrics()
+        assert metrics['sharpe_ratio'] == 0
+
     def test_risk_metrics_sharpe_zero_std(self):
         """Test Sharpe ratio when std is zero (constant P&L)"""
         self.mm.execute_trade(10000, 100.0, 'sell', 100.0, can_hedge=False)
@@ -838,6 +946,14 @@ class TestSimulateMarketMakerCrisis:
         assert mm.max_inventory == 50_000
         assert mm.target_spread_bps == 5.0
 
+    def test_simulate_crisis_uses_scenario_timestamps(self):
+        """Test that histories are stamped with market time, not wall-clock time"""
+        mm, _ = simulate_market_maker_crisis(200.0, self.scenario)
+
+        assert [p['timestamp'] for p in mm.pnl_history] == list(self.timeline)
+        assert all(r['timestamp'] in self.timeline for r in mm.position_history)
+        assert mm.position.timestamp == mm.position_history[-1]['timestamp']
+
     def test_simulate_crisis_spread_widening(self):
         """Test that spreads widen during crisis"""
         _, results = simulate_market_maker_crisis(200.0, self.scenario)
@@ -845,12 +961,23 @@ class TestSimulateMarketMakerCrisis:
         # Spread at start (normal conditions)
         spread_start = results['spread_bps'].iloc[0]
 
-        # Spread during crisis (high vol, no hedge)
-        spread_crisis = results['spread_bps'].iloc[4]
+        # Spread during crisis (no hedge, still quoting)
+        spread_crisis = results['spread_bps'].iloc[3]
 
         # Crisis spread should be wider
         assert spread_crisis > spread_start
 
+    def test_simulate_crisis_withdrawn_flag(self):
+        """Test that withdrawn bars are flagged and leave spreads finite"""
+        _, results = simulate_market_maker_crisis(200.0, self.scenario)
+
+        # No hedge + vol > 50% at idx 4 and 5
+        assert results['withdrawn'].dtype == bool
+        assert results['withdrawn'].tolist() == [False] * 4 + [True] * 2 + [False] * 4
+        assert results.loc[results['withdrawn'], 'spread_bps'].isna().all()
+        assert not np.isinf(results['spread_bps']).any()
+        assert np.isfinite(results['spread_bps'].mean())
+
     def test_simulate_crisis_discount_calculation(self):
         """Test that discount percentage is calculated correctly"""
         _, results = simulate_market_maker_crisis(200.0, self.scenario)
@@ -888,6 +1015,166 @@ class TestSimulateMarketMakerCrisis:
             assert spread_recovery < spread_crisis
 
 
+def _reference_crisis_loop(fair_value, crisis_scenario, mm_params=None):
+    """Bar-by-bar crisis replay through the public simulator methods."""
+    mm = MarketMakerSimulator(symbol='ETF', **(mm_params or {}))
+    rows = []
+
+    for i, timestamp in enumerate(crisis_scenario['timeline']):
+        etf_price = crisis_scenario['etf_prices'][i]
+        can_hedge = bool(crisis_scenario['hedge_availability'][i])
+        vol = crisis_scenario['volatility'][i]
+        flow = int(crisis_scenario['order_flow'][i])
+
+        hedge_status = HedgeStatus.FULL if can_hedge else HedgeStatus.NONE
+        quote = mm.quote_market(fair_value, hedge_status, vol)
+
+        if quote and flow != 0:
+            side = 'buy' if flow > 0 else 'sell'
+            if quote.bid and side == 'sell':
+                mm.execute_trade(abs(flow), quote.bid, side, fair_value, can_hedge)
+            elif quote.ask and side == 'buy':
+                mm.execute_trade(abs(flow), quote.ask, side, fair_value, can_hedge)
+
+        pnl = mm.mark_to_market(etf_price)
+        rows.append({
+            'spread_bps': quote.spread_bps if quote else np.nan,
+            'mm_active': mm.active,
+            'withdrawn': quote is None,
+            'inventory': mm.position.etf_inventory,
+            'pnl': pnl['total_pnl'],
+            'cumulative_return_pct': pnl['return_pct']
+        })
+
+    return mm, pd.DataFrame(rows)
+
+
+class TestSimulationMatchesReference:
+    """The array-based crisis simulation must match a bar-by-bar replay"""
+
+    @pytest.fixture(params=[0, 1, 2])
+    def random_scenario(self, request):
+        """Random scenarios that hit inventory limits, rejects and withdrawals"""
+        rng = np.random.default_rng(request.param)
+        n = 300
+        return {
+            'timeline': pd.date_range('2015-08-24 09:30', periods=n, freq='1s'),
+            'etf_prices': 200 + np.cumsum(rng.normal(0, 1, n)),
+            'hedge_availability': rng.random(n) > 0.3,
+            'volatility': rng.uniform(0.05, 0.9, n),
+            'order_flow': rng.integers(-30_000, 30_000, n)
+        }
+
+    def test_matches_reference_loop(self, random_scenario):
+        mm, results = simulate_market_maker_crisis(200.0, random_scenario)
+        ref_mm, expected = _reference_crisis_loop(200.0, random_scenario)
+
+        for col in ['mm_active', 'withdrawn', 'inventory']:
+            np.testing.assert_array_equal(results[col].values, expected[col].values)
+        np.testing.assert_allclose(results['spread_bps'].values, expected['spread_bps'].values,
+                                   rtol=1e-12)
+        np.testing.assert_allclose(results['pnl'].values, expected['pnl'].values,
+                                   rtol=1e-12, atol=1e-6)
+        np.testing.assert_allclose(results['cumulative_return_pct'].values,
+                                   expected['cumulative_return_pct'].values,
+                                   rtol=1e-12, atol=1e-9)
+
+        assert mm.active == ref_mm.active
+        assert mm.position.etf_inventory == ref_mm.position.etf_inventory
+        assert mm.position.underlying_hedge == ref_mm.position.underlying_hedge
+        assert mm.position.etf_entry_price == pytest.approx(ref_mm.position.etf_entry_price)
+        assert len(mm.pnl_history) == len(ref_mm.pnl_history)
+        assert len(mm.position_history) == len(ref_mm.position_history)
+
+        for record, ref_record in zip(mm.position_history, ref_mm.position_history):
+            for key in ['etf_inventory', 'hedge_position', 'net_delta', 'fair_value']:
+                assert record[key] == ref_record[key]
+            assert record['etf_price'] == pytest.approx(ref_record['etf_price'])
+
+    def test_float32_matches_float64(self, random_scenario):
+        mm64, results64 = simulate_market_maker_crisis(200.0, random_scenario)
+        mm32, results32 = simulate_market_maker_crisis(200.0, random_scenario,
+                                                       dtype=np.float32)
+
+        assert results32['pnl'].dtype == np.float32
+        np.testing.assert_array_equal(results32['inventory'].values,
+                                      results64['inventory'].values)
+        scale = np.abs(results64['pnl'].values).max()
+        np.testing.assert_allclose(results32['pnl'].values, results64['pnl'].values,
+                                   atol=1e-5 * scale)
+
+    def test_invalid_dtype_raises_error(self, random_scenario):
+        with pytest.raises(ValueError, match="dtype must be float32 or float64"):
+            simulate_market_maker_crisis(200.0, random_scenario, dtype=np.int64)
+
+    def test_matches_reference_with_custom_params(self, random_scenario):
+        mm_params = {'max_inventory': 50_000, 'target_spread_bps': 5.0}
+        _, results = simulate_market_maker_crisis(200.0, random_scenario, mm_params)
+        _, expected = _reference_crisis_loop(200.0, random_scenario, mm_params)
+
+        np.testing.assert_array_equal(results['inventory'].values,
+                                      expected['inventory'].values)
+        np.testing.assert_allclose(results['pnl'].values, expected['pnl'].values,
+                                   rtol=1e-12, atol=1e-6)
+
+
+class TestSimulationBatch:
+    """Tests for the multi-scenario crisis simulation"""
+
+    @pytest.fixture
+    def scenarios(self):
+        """Five random scenarios stacked row-wise"""
+        rng = np.random.default_rng(7)
+        shape = (5, 200)
+        return {
+            'etf_prices': 200 + np.cumsum(rng.normal(0, 1, shape), axis=1),
+            'hedge_availability': rng.random(shape) > 0.3,
+            'volatility': rng.uniform(0.05, 0.9, shape),
+            'order_flow': rng.integers(-30_000, 30_000, shape)
+        }
+
+    def test_rows_match_single_simulation(self, scenarios):
+        results = simulate_market_maker_crisis_batch(
+            200.0, scenarios['etf_prices'], scenarios['volatility'],
+            scenarios['hedge_availability'], scenarios['order_flow']
+        )
+
+        timeline = pd.date_range('2015-08-24 09:30', periods=200, freq='1s')
+        for s in range(5):
+            scenario = {key: values[s] for key, values in scenarios.items()}
+            scenario['timeline'] = timeline
+            _, expected = simulate_market_maker_crisis(200.0, scenario)
+
+            np.testing.assert_array_equal(results['inventory'][s], expected['inventory'].values)
+            np.testing.assert_array_equal(results['mm_active'][s], expected['mm_active'].values)
+            np.testing.assert_allclose(results['pnl'][s], expected['pnl'].values)
+
+    def test_output_shapes(self, scenarios):
+        results = simulate_market_maker_crisis_batch(
+            200.0, scenarios['etf_prices'], scenarios['volatility'],
+            scenarios['hedge_availability'], scenarios['order_flow'],
+            dtype=np.float32
+        )
+
+        for key in ['pnl', 'inventory', 'mm_active']:
+            assert results[key].shape == (5, 200)
+        assert results['pnl'].dtype == np.float32
+
+    def test_mismatched_shapes_raise_error(self, scenarios):
+        with pytest.raises(ValueError, match="does not match"):
+            simulate_market_maker_crisis_batch(
+                200.0, scenarios['etf_prices'], scenarios['volatility'][:, :-1],
+                scenarios['hedge_availability'], scenarios['order_flow']
+            )
+
+    def test_1d_input_raises_error(self, scenarios):
+        with pytest.raises(ValueError, match="must be 2-D"):
+            simulate_market_maker_crisis_batch(
+                200.0, scenarios['etf_prices'][0], scenarios['volatility'][0],
+                scenarios['hedge_availability'][0], scenarios['order_flow'][0]
+            )
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions"""
 
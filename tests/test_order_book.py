@@ -5,6 +5,7 @@ Educational tests demonstrating order book mechanics and air pockets.
 """
 
 import pytest
+import random
 import sys
 from pathlib import Path
 
@@ -12,7 +13,7 @@ from pathlib import Path
 src_dir = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_dir))
 
-from order_book import OrderBook, Order, simulate_stop_loss_cascade
+from order_book import OrderBook, Order, simulate_stop_loss_cascade, sweep_cascades
 
 
 class TestOrderBookBasics:
@@ -65,6 +66,86 @@ class TestOrderBookBasics:
         assert book.asks[2].price == 103.0
 
 
+    def test_equal_prices_keep_time_priority(self):
+        """Orders at the same price stay in arrival order"""
+        book = OrderBook()
+        book.add_bid(100.0, 100)
+        book.add_bid(100.0, 200)
+        book.add_bid(101.0, 300)
+        book.add_ask(102.0, 100)
+        book.add_ask(102.0, 200)
+
+        assert [o.size for o in book.bids] == [300, 100, 200]
+        assert [o.size for o in book.asks] == [100, 200]
+
+    def test_many_inserts_stay_sorted(self):
+        """Random inserts produce the same order as a full sort"""
+        rng = random.Random(0)
+        book = OrderBook()
+        prices = [round(rng.uniform(90, 110), 2) for _ in range(200)]
+        for p in prices:
+            book.add_bid(p, 100)
+            book.add_ask(p, 100)
+
+        assert [o.price for o in book.bids] == sorted(prices, reverse=True)
+        assert [o.price for o in book.asks] == sorted(prices)
+
+
+    def test_order_has_no_instance_dict(self):
+        """Orders use slots, so large books carry no per-order __dict__"""
+        order = Order(100.0, 500)
+
+        assert not hasattr(order, '__dict__')
+        with pytest.raises(AttributeError):
+            order.venue = 'NYSE'
+
+
+    def test_bids_view_is_snapshot(self):
+        """bids/asks are rebuilt from the book and do not alias it"""
+        book = OrderBook()
+        book.add_bid(100.0, 500)
+
+        view = book.bids
+        view[0].size = 1
+        view.clear()
+
+        assert len(book.bids) == 1
+        assert book.bids[0].size == 500
+
+
+    def test_from_sorted_arrays_matches_inserts(self):
+        """Bulk construction gives the same book as one insert per order"""
+        bids = [(100.0, 100), (99.0, 200), (99.0, 300), (97.0, 400)]
+        asks = [(101.0, 100), (101.0, 200), (103.0, 300)]
+        book = OrderBook.from_sorted_arrays([p for p, _ in bids], [s for _, s in bids],
+                                            [p for p, _ in asks], [s for _, s in asks])
+        ref = OrderBook()
+        for price, size in bids:
+            ref.add_bid(price, size)
+        for price, size in asks:
+            ref.add_ask(price, size)
+
+        assert [(o.price, o.size) for o in book.bids] == bids
+        assert [(o.price, o.size) for o in book.asks] == asks
+        assert book.get_spread() == ref.get_spread()
+        assert book.execute_market_sell(450) == ref.execute_market_sell(450)
+        book.add_ask(102.0, 50)
+        ref.add_ask(102.0, 50)
+        assert book.execute_market_buy(600) == ref.execute_market_buy(600)
+
+    def test_from_sorted_arrays_rejects_unsorted_bids(self):
+        """Bids must be given highest first"""
+        with pytest.raises(ValueError, match="highest first"):
+            OrderBook.from_sorted_arrays([99.0, 100.0], [100, 100])
+
+    def test_from_sorted_arrays_rejects_bad_sizes(self):
+        """Sizes are validated like single orders"""
+        with pytest.raises(ValueError, match="greater than zero"):
+            OrderBook.from_sorted_arrays([100.0], [0])
+        with pytest.raises(ValueError, match="same length"):
+            OrderBook.from_sorted_arrays([100.0, 99.0], [100])
+
+
 class TestSpreadCalculations:
     """Test bid-ask spread calculations"""
 
@@ -94,6 +175,29 @@ class TestSpreadCalculations:
         assert book.get_spread_bps() is None
 
 
+    def test_top_of_book_tracks_fills(self):
+        """Best bid/ask and spread follow inserts and consumed levels"""
+        book = OrderBook()
+        book.add_bid(99.0, 100)
+        book.add_bid(100.0, 100)
+        book.add_bid(98.0, 100)  # Behind the best bid
+        book.add_ask(101.0, 100)
+        book.add_ask(102.0, 100)
+        assert book.get_best_bid() == 100.0
+        assert book.get_spread() == 1.0
+
+        book.execute_market_sell(150)
+        book.execute_market_buy(100)
+        assert book.get_best_bid() == 99.0
+        assert book.get_best_ask() == 102.0
+        assert book.get_midpoint() == 100.5
+
+        book.execute_limit_buy(200, 103.0)  # Takes the last ask, rests 100
+        assert book.get_best_ask() is None
+        assert book.get_best_bid() == 103.0
+        assert book.get_spread() is None
+
+
 class TestMarketOrders:
     """Test market order execution"""
 
@@ -173,6 +277,68 @@ class TestMarketOrders:
             book.execute_market_buy(500)
 
 
+    def test_execute_market_sell_exact_level_boundary(self):
+        """Selling exactly through a level removes it without a zero fill"""
+        book = OrderBook()
+        book.add_bid(100.0, 500)
+        book.add_bid(99.0, 300)
+
+        fills = book.execute_market_sell(500)
+
+        assert fills == [(100.0, 500)]
+        assert book.get_best_bid() == 99.0
+
+    def test_execute_market_sell_insufficient_liquidity_drains_book(self):
+        """An unfillable sell takes all bids before raising"""
+        book = OrderBook()
+        book.add_bid(100.0, 100)
+        book.add_bid(99.0, 100)
+
+        with pytest.raises(ValueError, match="300 shares unfilled"):
+            book.execute_market_sell(500)
+        assert len(book.bids) == 0
+
+    def test_market_orders_match_level_by_level_walk(self):
+        """Vectorized fills match walking the book one level at a time"""
+        rng = random.Random(1)
+        for _ in range(50):
+            levels = [(round(rng.uniform(90, 100), 2), rng.randint(1, 500))
+                      for _ in range(rng.randint(1, 30))]
+            book = OrderBook()
+            for price, size in levels:
+                book.add_bid(price, size)
+            total = sum(size for _, size in levels)
+            order_size = rng.randint(1, total)
+
+            expected = []
+            remaining = order_size
+            for order in book.bids:
+                take = min(remaining, order.size)
+                expected.append((order.price, take))
+                remaining -= take
+                if remaining == 0:
+                    break
+
+            assert book.execute_market_sell(order_size) == expected
+            assert sum(o.size for o in book.bids) == total - order_size
+
+
+    def test_market_sell_totals_match_fills(self):
+        """The aggregate sell path reports the same totals as the fill list"""
+        book, agg_book = OrderBook(), OrderBook()
+        for price, size in [(100.0, 500), (99.0, 300), (90.0, 400)]:
+            book.add_bid(price, size)
+            agg_book.add_bid(price, size)
+
+        fills = book.execute_market_sell(1000)
+        total_value, total_qty, n_levels = agg_book._execute_market_sell_agg(1000)
+
+        assert total_value == sum(price * qty for price, qty in fills)
+        assert total_qty == 1000
+        assert n_levels == len(fills)
+        assert [(o.price, o.size) for o in agg_book.bids] == [(90.0, 200)]
+
+
 class TestLimitOrders:
     """Test limit order execution"""
 
@@ -214,6 +380,35 @@ class TestLimitOrders:
         assert book.bids[0].size == 300  # 500 - 200 resting
 
 
+def _reference_cascade(initial_price, stop_levels, order_sizes, book):
+    """Stop-by-stop cascade replay through execute_market_sell."""
+    stops = sorted(zip(stop_levels, order_sizes), key=lambda x: x[0], reverse=True)
+    triggers, executions = [], []
+    current_price = initial_price
+
+    if stops and current_price > stops[0][0]:
+        try:
+            fills = book.execute_market_sell(100)
+            current_price = sum(p * q for p, q in fills) / sum(q for _, q in fills)
+        except ValueError:
+            pass
+
+    cascade_started = False
+    for trigger_price, size in stops:
+        if current_price <= trigger_price or cascade_started:
+            cascade_started = True
+            try:
+                fills = book.execute_market_sell(size)
+            except ValueError:
+                break
+            avg_price = sum(p * q for p, q in fills) / sum(q for _, q in fills)
+            triggers.append(trigger_price)
+            executions.append(avg_price)
+            current_price = avg_price
+
+    return {'triggers': triggers, 'executions': executions}
+
+
 class TestStopLossCascade:
     """Test stop-loss cascade simulation"""
 
@@ -238,6 +433,75 @@ class TestStopLossCascade:
             assert execution < trigger
 
 
+    def test_cascade_matches_order_by_order_replay(self):
+        """The compiled cascade matches replaying each stop as a market sell"""
+        rng = random.Random(2)
+        for _ in range(50):
+            levels = [(round(rng.uniform(80, 99.5), 2), rng.randint(50, 400))
+                      for _ in range(rng.randint(0, 25))]
+            stops = [round(rng.uniform(85, 101), 2) for _ in range(rng.randint(0, 10))]
+            sizes = [rng.randint(0, 800) for _ in stops]
+
+            book, ref_book = OrderBook(), OrderBook()
+            for price, size in levels:
+                book.add_bid(price, size)
+                ref_book.add_bid(price, size)
+
+            result = simulate_stop_loss_cascade(100.0, stops, sizes, book)
+            expected = _reference_cascade(100.0, stops, sizes, ref_book)
+
+            assert result['triggers'] == expected['triggers']
+            assert result['executions'] == pytest.approx(expected['executions'], rel=1e-12)
+            assert [(o.price, o.size) for o in book.bids] == \
+                [(o.price, o.size) for o in ref_book.bids]
+
+    def test_cascade_with_empty_stops(self):
+        """No stops means no executions and an untouched book"""
+        book = OrderBook()
+        book.add_bid(99.0, 500)
+
+        result = simulate_stop_loss_cascade(100.0, [], [], book)
+
+        assert result == {'triggers': [], 'executions': [],
+                          'slippage': [], 'slippage_pct': []}
+        assert book.bids[0].size == 500
+
+
+    def test_cascade_on_copy_leaves_book_intact(self):
+        """Scenario sweeps can reuse one base book through copy()"""
+        base = OrderBook.from_sorted_arrays([99.0, 98.0, 95.0], [200, 150, 400],
+                                            [101.0], [100])
+
+        first = simulate_stop_loss_cascade(100.0, [99.5, 98.5], [200, 200], base.copy())
+        second = simulate_stop_loss_cascade(100.0, [99.5, 98.5], [200, 200], base.copy())
+
+        assert first == second
+        assert [(o.price, o.size) for o in base.bids] == [(99.0, 200), (98.0, 150), (95.0, 400)]
+        assert base.get_spread() == 2.0
+
+
+    def test_sweep_cascades_matches_individual_runs(self):
+        """Parallel sweeps return the same results, in order, as single runs"""
+        base = OrderBook.from_sorted_arrays([99.0, 98.0, 95.0, 90.0], [200, 150, 400, 800])
+        scenarios = [
+            {'initial_price': 100.0, 'stop_levels': [99.5, 98.5], 'order_sizes': [size, size]}
+            for size in (100, 300, 500)
+        ]
+        scenarios.append({'initial_price': 50.0, 'stop_levels': [49.0], 'order_sizes': [250]})
+
+        expected = [
+            simulate_stop_loss_cascade(s['initial_price'], s['stop_levels'],
+                                       s['order_sizes'], base.copy())
+            for s in scenarios[:3]
+        ]
+        expected.append(simulate_stop_loss_cascade(50.0, [49.0], [250]))
+        scenarios[3]['initial_book'] = None  # Falls back to the default book
+
+        assert sweep_cascades(scenarios, n_workers=2, base_book=base) == expected
+        assert sweep_cascades(scenarios, n_workers=1, base_book=base) == expected
+        assert base.bids[0].size == 200  # Base book untouched
+
+
 class TestDisplayFunctions:
     """Test display and formatting"""
 
@@ -281,5 +545,21 @@ class TestEdgeCases:
             book.add_bid(100.0, -500)
 
 
+    def test_order_validation(self):
+        """Orders built directly are validated like book inserts"""
+        with pytest.raises(ValueError, match="non-negative"):
+            Order(0.0, 100)
+        with pytest.raises(ValueError, match="greater than zero"):
+            Order(100.0, 0)
+
+    def test_negative_ask_price(self):
+        """Ask inserts are validated too"""
+        book = OrderBook()
+
+        with pytest.raises(ValueError, match="non-negative"):
+            book.add_ask(-1.0, 500)
+        assert len(book.asks) == 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])